@@ -12,22 +12,45 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import heapq
 import json
 import re
 import sys
-from dataclasses import dataclass, field, asdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict, fields
 from datetime import datetime, timedelta
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from statistics import mean, median
+from statistics import median
 from typing import Optional
 
+try:  # optional — enables vectorized batch scoring on large imports
+    import numpy as np
+except ImportError:
+    np = None
+
+try:  # optional — C-level JSON parse/serialize for large exports and history
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional — JIT-compiles the composite scoring kernel for big batches
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Paths
 # ─────────────────────────────────────────────────────────────────────────────
 
 DATA_DIR = Path(__file__).parent.parent / "data"
 BENCHMARKS_FILE = DATA_DIR / "benchmarks.json"
-HISTORY_FILE = DATA_DIR / "performance_history.json"
+HISTORY_FILE = DATA_DIR / "performance_history.jsonl"
+_LEGACY_HISTORY_FILE = DATA_DIR / "performance_history.json"
+AGGREGATES_FILE = DATA_DIR / "performance_aggregates.json"
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Niche benchmarks (LinkedIn-first; scaled for other platforms)
@@ -81,6 +104,19 @@ NICHE_BENCHMARKS: dict[str, dict] = {
     },
 }
 
+# Flattened benchmark tables — integer indexing in the scoring hot path
+# instead of two chained dict lookups per post.
+NICHE_IX: dict[str, int] = {niche: i for i, niche in enumerate(NICHE_BENCHMARKS)}
+PLATFORM_IX: dict[str, int] = {"linkedin": 0, "instagram": 1, "twitter": 2}
+_ENG_TARGETS = tuple(c["engagement_target"] for c in NICHE_BENCHMARKS.values())
+_COMMENT_TARGETS = tuple(c["comment_rate_target"] for c in NICHE_BENCHMARKS.values())
+_SAVE_TARGETS = tuple(c["save_rate_target"] for c in NICHE_BENCHMARKS.values())
+_SHARE_TARGETS = tuple(c["share_rate_target"] for c in NICHE_BENCHMARKS.values())
+_PLATFORM_SCALE = tuple(
+    tuple(c["platform_scale"].get(p, 1.0) for p in PLATFORM_IX)
+    for c in NICHE_BENCHMARKS.values()
+)
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Content format patterns
 # ─────────────────────────────────────────────────────────────────────────────
@@ -96,11 +132,54 @@ FORMAT_PATTERNS: dict[str, list[str]] = {
     "contrarian":      [r"\bwrong\b", r"\blie\b", r"\bmyth\b", r"\bunpopular\b", r"\bno one says\b"],
 }
 
+# Fused alternations compiled once at import — one regex pass per format/niche
+# instead of one re.search per pattern string.
+FORMAT_PATTERNS_COMPILED: dict[str, re.Pattern] = {
+    fmt: re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE | re.MULTILINE)
+    for fmt, patterns in FORMAT_PATTERNS.items()
+}
+
+NICHE_PILLAR_PATTERNS: dict[str, re.Pattern] = {
+    niche: re.compile("|".join(re.escape(p) for p in config["pillars"]))
+    for niche, config in NICHE_BENCHMARKS.items()
+}
+
+try:  # optional — batch-compiled multi-pattern scan (fastest when present)
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+if hyperscan is not None:
+    _HS_PILLARS: list[tuple[str, str]] = []  # pattern id → (niche, pillar)
+    _hs_exprs: list[bytes] = []
+    for _niche, _config in NICHE_BENCHMARKS.items():
+        for _pillar in _config["pillars"]:
+            _hs_exprs.append(re.escape(_pillar).encode())
+            _HS_PILLARS.append((_niche, _pillar))
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(expressions=_hs_exprs, ids=list(range(len(_hs_exprs))))
+else:
+    _HS_DB = None
+
+try:  # optional — single-pass multi-pattern pillar matching (C extension)
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+if ahocorasick is not None:
+    _PILLAR_AUTOMATON = ahocorasick.Automaton()
+    for _niche, _config in NICHE_BENCHMARKS.items():
+        for _pillar in _config["pillars"]:
+            _PILLAR_AUTOMATON.add_word(_pillar, (_niche, _pillar))
+    _PILLAR_AUTOMATON.make_automaton()
+else:
+    _PILLAR_AUTOMATON = None
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Data classes
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class PostMetrics:
     post_id: str
     niche: str                       # detected or provided
@@ -109,6 +188,10 @@ class PostMetrics:
     content_preview: str             # first 120 chars
     format_type: str = "unknown"     # detected content format
     hook_words: str = ""             # first line extracted
+    hook_display: str = ""           # truncated hook for report rendering
+    preview_key: str = ""            # lowercased 60-char dedupe key
+    hashtag_key: tuple = ()          # interned tag-id tuple for grouping
+    published_dt: Optional[datetime] = None  # parsed once at ingest
     # Engagement
     impressions: int = 0
     reach: int = 0
@@ -129,7 +212,17 @@ class PostMetrics:
     notes: str = ""
 
 
-@dataclass
+# History persists every PostMetrics field except the derived ingest-time
+# caches. The field tuple + attrgetter pair serializes a record with plain
+# attribute reads — no asdict recursion, no per-record pop() calls.
+_PM_DERIVED = ("hook_display", "preview_key", "hashtag_key", "published_dt")
+_PM_PERSIST_FIELDS = tuple(
+    f.name for f in fields(PostMetrics) if f.name not in _PM_DERIVED
+)
+_PM_GET = attrgetter(*_PM_PERSIST_FIELDS)
+
+
+@dataclass(slots=True)
 class TopicInsight:
     title: str
     avg_engagement: float
@@ -138,7 +231,7 @@ class TopicInsight:
     best_post_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class NichePerformance:
     niche: str
     platform: str
@@ -164,7 +257,7 @@ class NichePerformance:
     trend_delta: float          # percentage point change
 
 
-@dataclass
+@dataclass(slots=True)
 class CompetitorInsight:
     name: str
     platform: str
@@ -175,7 +268,7 @@ class CompetitorInsight:
     suggested_response: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklyBrief:
     period: str
     period_start: str
@@ -211,12 +304,42 @@ def _safe_float(val) -> float:
         return 0.0
 
 
+@functools.lru_cache(maxsize=4096)
 def _detect_niche(content: str) -> str:
-    """Detect which niche a post belongs to based on content keywords."""
+    """Detect which niche a post belongs to based on content keywords.
+
+    Callers pass a 200-char prefix so repeated/reposted leading text hits
+    the cache instead of re-running pattern matching.
+    """
     text = content.lower()
+    if _HS_DB is not None:
+        hits: dict[str, set[str]] = {}
+
+        def _on_match(pat_id, start, end, flags, ctx=None):
+            niche, pillar = _HS_PILLARS[pat_id]
+            hits.setdefault(niche, set()).add(pillar)
+
+        _HS_DB.scan(text.encode(), match_event_handler=_on_match)
+        if hits:
+            # Same benchmark-order tie-break as the other match paths —
+            # Hyperscan reports matches by end offset, not a stable order.
+            return max((n for n in NICHE_BENCHMARKS if n in hits),
+                       key=lambda n: len(hits[n]))
+        return "ttbp"  # default
+    if _PILLAR_AUTOMATON is not None:
+        # One pass over the text reports every pillar hit across all niches
+        hits: dict[str, set[str]] = {}
+        for _, (niche, pillar) in _PILLAR_AUTOMATON.iter(text):
+            hits.setdefault(niche, set()).add(pillar)
+        if hits:
+            # Ties break by NICHE_BENCHMARKS order, matching the regex
+            # fallback — not by which niche matched earliest in the text.
+            return max((n for n in NICHE_BENCHMARKS if n in hits),
+                       key=lambda n: len(hits[n]))
+        return "ttbp"  # default
     scores: dict[str, int] = {}
-    for niche, config in NICHE_BENCHMARKS.items():
-        score = sum(1 for pillar in config["pillars"] if pillar in text)
+    for niche, pattern in NICHE_PILLAR_PATTERNS.items():
+        score = len(set(pattern.findall(text)))
         if score > 0:
             scores[niche] = score
     if scores:
@@ -224,12 +347,64 @@ def _detect_niche(content: str) -> str:
     return "ttbp"  # default
 
 
+def _json_load_path(path: Path):
+    """Parse a JSON file with orjson when available, stdlib json otherwise."""
+    data = path.read_bytes() if isinstance(path, Path) else Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _json_dump_path(obj, path: Path) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def _parse_published(published_at: str) -> Optional[datetime]:
+    """Parse an ISO-ish published timestamp once; None if unparseable."""
+    try:
+        return datetime.fromisoformat(published_at.replace("Z", "+00:00").split("+")[0])
+    except (ValueError, AttributeError):
+        return None
+
+
+# Hashtag interning — tuple-of-int keys hash far cheaper than the joined
+# sorted-string keys they replace in hashtag grouping.
+TAG_ID: dict[str, int] = {}
+_TAG_BY_ID: list[str] = []
+
+
+def _tag_id(tag: str) -> int:
+    i = TAG_ID.get(tag)
+    if i is None:
+        i = len(TAG_ID)
+        TAG_ID[tag] = i
+        _TAG_BY_ID.append(tag)
+    return i
+
+
+def _hashtag_key(hashtags: list[str]) -> tuple:
+    return tuple(sorted(_tag_id(t) for t in hashtags[:4]))
+
+
+def _finalize_post(p: PostMetrics) -> None:
+    """Set derived fields once at ingest so hot loops never re-slice."""
+    p.published_dt = _parse_published(p.published_at)
+    hook = p.hook_words
+    p.hook_display = hook[:70] + "..." if len(hook) > 70 else hook
+    p.preview_key = p.content_preview[:60].lower()
+    p.hashtag_key = _hashtag_key(p.hashtags)
+
+
+@functools.lru_cache(maxsize=4096)
 def _detect_format(content: str) -> str:
     """Detect the content format from the post text."""
-    for fmt, patterns in FORMAT_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, content, re.IGNORECASE | re.MULTILINE):
-                return fmt
+    for fmt, pattern in FORMAT_PATTERNS_COMPILED.items():
+        if pattern.search(content):
+            return fmt
     return "narrative"
 
 
@@ -253,20 +428,20 @@ def _compute_rates(post: PostMetrics) -> PostMetrics:
 
 def _score_post(post: PostMetrics) -> PostMetrics:
     """Compute composite score (0-100) vs benchmark."""
-    bench = NICHE_BENCHMARKS.get(post.niche, NICHE_BENCHMARKS["ttbp"])
-    target = bench["engagement_target"]
-    scale = bench["platform_scale"].get(post.platform, 1.0)
-    scaled_target = target * scale
+    ix = NICHE_IX.get(post.niche, 0)
+    p_ix = PLATFORM_IX.get(post.platform)
+    scale = _PLATFORM_SCALE[ix][p_ix] if p_ix is not None else 1.0
+    scaled_target = _ENG_TARGETS[ix] * scale
 
     # Engagement rate component (50%)
     eng_score = min(50, (post.engagement_rate / scaled_target) * 50) if scaled_target > 0 else 0
 
     # Comment + save weight (30%)
-    comment_score = min(15, (post.comment_rate / bench["comment_rate_target"]) * 15) if bench["comment_rate_target"] > 0 else 0
-    save_score = min(15, (post.save_rate / bench["save_rate_target"]) * 15) if bench["save_rate_target"] > 0 else 0
+    comment_score = min(15, (post.comment_rate / _COMMENT_TARGETS[ix]) * 15) if _COMMENT_TARGETS[ix] > 0 else 0
+    save_score = min(15, (post.save_rate / _SAVE_TARGETS[ix]) * 15) if _SAVE_TARGETS[ix] > 0 else 0
 
     # Share + click (20%)
-    share_score = min(10, (post.share_rate / bench["share_rate_target"]) * 10) if bench["share_rate_target"] > 0 else 0
+    share_score = min(10, (post.share_rate / _SHARE_TARGETS[ix]) * 10) if _SHARE_TARGETS[ix] > 0 else 0
     click_score = min(10, post.click_rate * 5)  # bonus for CTR
 
     post.composite_score = round(eng_score + comment_score + save_score + share_score + click_score, 1)
@@ -274,13 +449,116 @@ def _score_post(post: PostMetrics) -> PostMetrics:
     return post
 
 
+_BATCH_VECTOR_MIN = 64  # below this, array setup costs more than it saves
+
+if njit is not None:
+
+    # No fastmath: it licenses reassociation, and the kernel is branch/min
+    # work, not a reduction — scores must match _score_post bit-for-bit.
+    @njit(parallel=True, cache=True)
+    def _composite_kernel(eng, com, sav, sha, cli, t_eng, t_com, t_sav, t_sha,
+                          out_score, out_delta):  # pragma: no cover - needs numba
+        for i in prange(eng.shape[0]):
+            score = 0.0
+            if t_eng[i] > 0:
+                score += min(50.0, eng[i] / t_eng[i] * 50.0)
+            if t_com[i] > 0:
+                score += min(15.0, com[i] / t_com[i] * 15.0)
+            if t_sav[i] > 0:
+                score += min(15.0, sav[i] / t_sav[i] * 15.0)
+            if t_sha[i] > 0:
+                score += min(10.0, sha[i] / t_sha[i] * 10.0)
+            score += min(10.0, cli[i] * 5.0)
+            out_score[i] = score
+            out_delta[i] = eng[i] - t_eng[i]
+
+
+def _score_batch(posts: list[PostMetrics]) -> list[PostMetrics]:
+    """Compute rates + composite scores for a whole batch of posts.
+
+    When NumPy is available and the batch is large enough, engagement
+    counters are gathered into structure-of-arrays columns and all rates,
+    scores, and benchmark deltas are computed in a few vectorized passes.
+    Falls back to the per-post path otherwise.
+    """
+    if np is None or len(posts) < _BATCH_VECTOR_MIN:
+        for p in posts:
+            _score_post(_compute_rates(p))
+        return posts
+
+    n = len(posts)
+    imp = np.fromiter((p.impressions for p in posts), dtype=np.int64, count=n)
+    reach = np.fromiter((p.reach for p in posts), dtype=np.int64, count=n)
+    likes = np.fromiter((p.likes for p in posts), dtype=np.int64, count=n)
+    comments = np.fromiter((p.comments for p in posts), dtype=np.int64, count=n)
+    shares = np.fromiter((p.shares for p in posts), dtype=np.int64, count=n)
+    saves = np.fromiter((p.saves for p in posts), dtype=np.int64, count=n)
+    clicks = np.fromiter((p.clicks for p in posts), dtype=np.int64, count=n)
+
+    base = np.where(imp > 0, imp, np.maximum(reach, 1)).astype(np.float64)
+    eng_rate = np.round((likes + comments + shares + saves) / base * 100, 2)
+    comment_rate = np.round(comments / base * 100, 2)
+    save_rate = np.round(saves / base * 100, 2)
+    share_rate = np.round(shares / base * 100, 2)
+    click_rate = np.round(clicks / base * 100, 2)
+
+    # Gather per-post benchmark constants (small dict lookups, one pass)
+    def _bench_cols():
+        for p in posts:
+            ix = NICHE_IX.get(p.niche, 0)
+            p_ix = PLATFORM_IX.get(p.platform)
+            scale = _PLATFORM_SCALE[ix][p_ix] if p_ix is not None else 1.0
+            yield (_ENG_TARGETS[ix] * scale, _COMMENT_TARGETS[ix],
+                   _SAVE_TARGETS[ix], _SHARE_TARGETS[ix])
+
+    bench_arr = np.array(list(_bench_cols()), dtype=np.float64)
+    scaled_target, c_target, sv_target, sh_target = bench_arr.T
+
+    if njit is not None:
+        composite = np.empty(n, dtype=np.float64)
+        delta = np.empty(n, dtype=np.float64)
+        _composite_kernel(
+            eng_rate, comment_rate, save_rate, share_rate, click_rate,
+            np.ascontiguousarray(scaled_target), np.ascontiguousarray(c_target),
+            np.ascontiguousarray(sv_target), np.ascontiguousarray(sh_target),
+            composite, delta,
+        )
+    else:
+        def _component(rate, target, cap):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                score = np.where(target > 0, np.minimum(cap, rate / target * cap), 0.0)
+            return score
+
+        composite = (
+            _component(eng_rate, scaled_target, 50)
+            + _component(comment_rate, c_target, 15)
+            + _component(save_rate, sv_target, 15)
+            + _component(share_rate, sh_target, 10)
+            + np.minimum(10, click_rate * 5)
+        )
+        delta = eng_rate - scaled_target
+
+    # Composite and delta are rounded per-post with Python round(), not
+    # np.round — the two disagree at half-way edges, and scores must match
+    # the scalar _score_post path exactly regardless of batch size.
+    for i, p in enumerate(posts):
+        p.engagement_rate = float(eng_rate[i])
+        p.comment_rate = float(comment_rate[i])
+        p.save_rate = float(save_rate[i])
+        p.share_rate = float(share_rate[i])
+        p.click_rate = float(click_rate[i])
+        p.composite_score = round(float(composite[i]), 1)
+        p.benchmark_delta = round(float(delta[i]), 2)
+    return posts
+
+
 def _parse_contentstudio_json(raw: dict | list) -> list[PostMetrics]:
     """Parse ContentStudio analytics export (JSON)."""
     posts = []
     items = raw if isinstance(raw, list) else raw.get("data", raw.get("posts", []))
     for item in items:
         content = item.get("message", item.get("content", item.get("caption", "")))
-        niche = item.get("niche") or _detect_niche(content)
+        niche = item.get("niche") or _detect_niche(content[:200])
         platform = item.get("platform", item.get("social_account_type", "linkedin")).lower()
         p = PostMetrics(
             post_id=str(item.get("id", item.get("post_id", ""))),
@@ -288,7 +566,7 @@ def _parse_contentstudio_json(raw: dict | list) -> list[PostMetrics]:
             platform=platform,
             published_at=str(item.get("published_at", item.get("created_at", ""))),
             content_preview=content[:120],
-            format_type=_detect_format(content),
+            format_type=_detect_format(content[:200]),
             hook_words=_extract_hook(content),
             impressions=_safe_int(item.get("impressions", item.get("reach", 0))),
             reach=_safe_int(item.get("reach", 0)),
@@ -299,91 +577,131 @@ def _parse_contentstudio_json(raw: dict | list) -> list[PostMetrics]:
             clicks=_safe_int(item.get("link_clicks", item.get("clicks", 0))),
             hashtags=item.get("hashtags", []),
         )
-        posts.append(_score_post(_compute_rates(p)))
-    return posts
+        _finalize_post(p)
+        posts.append(p)
+    return _score_batch(posts)
+
+
+def _col(col_idx: dict[str, int], *names: str) -> int:
+    """Resolve the first matching column name to its index (-1 if absent)."""
+    for name in names:
+        i = col_idx.get(name)
+        if i is not None:
+            return i
+    return -1
+
 
+def _cell(row: list[str], i: int) -> str:
+    return row[i] if 0 <= i < len(row) else ""
 
-def _parse_linkedin_csv(rows: list[dict]) -> list[PostMetrics]:
+
+def _parse_linkedin_csv(col_idx: dict[str, int], rows) -> list[PostMetrics]:
     """Parse LinkedIn native analytics CSV export."""
+    i_content = _col(col_idx, "Post Content", "content")
+    i_id = _col(col_idx, "Post ID", "id")
+    i_date = _col(col_idx, "Date", "Published Date")
+    i_imp = _col(col_idx, "Impressions")
+    i_reach = _col(col_idx, "Unique Views", "Reach")
+    i_likes = _col(col_idx, "Likes", "Reactions")
+    i_comments = _col(col_idx, "Comments")
+    i_shares = _col(col_idx, "Shares", "Reposts")
+    i_clicks = _col(col_idx, "Clicks", "Link Clicks")
     posts = []
     for row in rows:
-        content = row.get("Post Content", row.get("content", ""))
-        niche = _detect_niche(content)
+        content = _cell(row, i_content)
+        niche = _detect_niche(content[:200])
         p = PostMetrics(
-            post_id=row.get("Post ID", row.get("id", "")),
+            post_id=_cell(row, i_id),
             niche=niche,
             platform="linkedin",
-            published_at=row.get("Date", row.get("Published Date", "")),
+            published_at=_cell(row, i_date),
             content_preview=content[:120],
-            format_type=_detect_format(content),
+            format_type=_detect_format(content[:200]),
             hook_words=_extract_hook(content),
-            impressions=_safe_int(row.get("Impressions", 0)),
-            reach=_safe_int(row.get("Unique Views", row.get("Reach", 0))),
-            likes=_safe_int(row.get("Likes", row.get("Reactions", 0))),
-            comments=_safe_int(row.get("Comments", 0)),
-            shares=_safe_int(row.get("Shares", row.get("Reposts", 0))),
+            impressions=_safe_int(_cell(row, i_imp)),
+            reach=_safe_int(_cell(row, i_reach)),
+            likes=_safe_int(_cell(row, i_likes)),
+            comments=_safe_int(_cell(row, i_comments)),
+            shares=_safe_int(_cell(row, i_shares)),
             saves=0,  # LinkedIn CSV doesn't include saves
-            clicks=_safe_int(row.get("Clicks", row.get("Link Clicks", 0))),
+            clicks=_safe_int(_cell(row, i_clicks)),
         )
-        posts.append(_score_post(_compute_rates(p)))
-    return posts
+        _finalize_post(p)
+        posts.append(p)
+    return _score_batch(posts)
 
 
-def _parse_instagram_csv(rows: list[dict]) -> list[PostMetrics]:
+def _parse_instagram_csv(col_idx: dict[str, int], rows) -> list[PostMetrics]:
     """Parse Instagram / Meta Business Suite CSV export."""
+    i_content = _col(col_idx, "Description", "Caption", "Text")
+    i_id = _col(col_idx, "Post ID", "Media ID")
+    i_date = _col(col_idx, "Date Published", "Publish Time")
+    i_imp = _col(col_idx, "Impressions")
+    i_reach = _col(col_idx, "Reach", "Accounts Reached")
+    i_likes = _col(col_idx, "Likes")
+    i_comments = _col(col_idx, "Comments")
+    i_shares = _col(col_idx, "Shares")
+    i_saves = _col(col_idx, "Saves", "Bookmarks")
+    i_clicks = _col(col_idx, "Profile Visits", "Link Clicks")
     posts = []
     for row in rows:
-        content = row.get("Description", row.get("Caption", row.get("Text", "")))
-        niche = _detect_niche(content)
+        content = _cell(row, i_content)
+        niche = _detect_niche(content[:200])
         p = PostMetrics(
-            post_id=row.get("Post ID", row.get("Media ID", "")),
+            post_id=_cell(row, i_id),
             niche=niche,
             platform="instagram",
-            published_at=row.get("Date Published", row.get("Publish Time", "")),
+            published_at=_cell(row, i_date),
             content_preview=content[:120],
-            format_type=_detect_format(content),
+            format_type=_detect_format(content[:200]),
             hook_words=_extract_hook(content),
-            impressions=_safe_int(row.get("Impressions", 0)),
-            reach=_safe_int(row.get("Reach", row.get("Accounts Reached", 0))),
-            likes=_safe_int(row.get("Likes", 0)),
-            comments=_safe_int(row.get("Comments", 0)),
-            shares=_safe_int(row.get("Shares", 0)),
-            saves=_safe_int(row.get("Saves", row.get("Bookmarks", 0))),
-            clicks=_safe_int(row.get("Profile Visits", row.get("Link Clicks", 0))),
+            impressions=_safe_int(_cell(row, i_imp)),
+            reach=_safe_int(_cell(row, i_reach)),
+            likes=_safe_int(_cell(row, i_likes)),
+            comments=_safe_int(_cell(row, i_comments)),
+            shares=_safe_int(_cell(row, i_shares)),
+            saves=_safe_int(_cell(row, i_saves)),
+            clicks=_safe_int(_cell(row, i_clicks)),
         )
-        posts.append(_score_post(_compute_rates(p)))
-    return posts
+        _finalize_post(p)
+        posts.append(p)
+    return _score_batch(posts)
 
 
-def _parse_twitter_csv(rows: list[dict]) -> list[PostMetrics]:
+def _parse_twitter_csv(col_idx: dict[str, int], rows) -> list[PostMetrics]:
     """Parse Twitter/X analytics CSV export."""
+    i_content = _col(col_idx, "Tweet text", "text")
+    i_id = _col(col_idx, "Tweet id", "id")
+    i_date = _col(col_idx, "time", "created_at")
+    i_imp = _col(col_idx, "impressions")
+    i_likes = _col(col_idx, "likes", "favorites")
+    i_comments = _col(col_idx, "replies")
+    i_shares = _col(col_idx, "retweets")
+    i_saves = _col(col_idx, "bookmarks")
+    i_clicks = _col(col_idx, "url clicks", "link_clicks")
     posts = []
     for row in rows:
-        content = row.get("Tweet text", row.get("text", ""))
-        niche = _detect_niche(content)
+        content = _cell(row, i_content)
+        niche = _detect_niche(content[:200])
         p = PostMetrics(
-            post_id=row.get("Tweet id", row.get("id", "")),
+            post_id=_cell(row, i_id),
             niche=niche,
             platform="twitter",
-            published_at=row.get("time", row.get("created_at", "")),
+            published_at=_cell(row, i_date),
             content_preview=content[:120],
-            format_type=_detect_format(content),
+            format_type=_detect_format(content[:200]),
             hook_words=_extract_hook(content),
-            impressions=_safe_int(row.get("impressions", 0)),
-            reach=_safe_int(row.get("impressions", 0)),
-            likes=_safe_int(row.get("likes", row.get("favorites", 0))),
-            comments=_safe_int(row.get("replies", 0)),
-            shares=_safe_int(row.get("retweets", 0)),
-            saves=_safe_int(row.get("bookmarks", 0)),
-            clicks=_safe_int(row.get("url clicks", row.get("link_clicks", 0))),
+            impressions=_safe_int(_cell(row, i_imp)),
+            reach=_safe_int(_cell(row, i_imp)),
+            likes=_safe_int(_cell(row, i_likes)),
+            comments=_safe_int(_cell(row, i_comments)),
+            shares=_safe_int(_cell(row, i_shares)),
+            saves=_safe_int(_cell(row, i_saves)),
+            clicks=_safe_int(_cell(row, i_clicks)),
         )
-        posts.append(_score_post(_compute_rates(p)))
-    return posts
-
-
-def _load_csv(path: Path) -> list[dict]:
-    with open(path, "r", encoding="utf-8-sig") as f:
-        return list(csv.DictReader(f))
+        _finalize_post(p)
+        posts.append(p)
+    return _score_batch(posts)
 
 
 def load_posts_from_file(path: Path, source: str = "auto") -> list[PostMetrics]:
@@ -394,40 +712,57 @@ def load_posts_from_file(path: Path, source: str = "auto") -> list[PostMetrics]:
 
     ext = path.suffix.lower()
     if ext == ".json":
-        with open(path, "r", encoding="utf-8") as f:
-            raw = json.load(f)
-        return _parse_contentstudio_json(raw)
+        return _parse_contentstudio_json(_json_load_path(path))
 
     if ext == ".csv":
-        rows = _load_csv(path)
-        if not rows:
-            return []
-        headers = set(rows[0].keys())
-        # Detect platform from CSV headers
-        if source != "auto":
-            src = source.lower()
-        elif "Tweet text" in headers or "Tweet id" in headers:
-            src = "twitter"
-        elif "Description" in headers or "Media ID" in headers or "Accounts Reached" in headers:
-            src = "instagram"
-        else:
-            src = "linkedin"
-
-        parsers = {"linkedin": _parse_linkedin_csv, "instagram": _parse_instagram_csv, "twitter": _parse_twitter_csv}
-        return parsers.get(src, _parse_linkedin_csv)(rows)
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                return []
+            col_idx = {name: i for i, name in enumerate(header)}
+            # Detect platform from CSV headers
+            if source != "auto":
+                src = source.lower()
+            elif "Tweet text" in col_idx or "Tweet id" in col_idx:
+                src = "twitter"
+            elif "Description" in col_idx or "Media ID" in col_idx or "Accounts Reached" in col_idx:
+                src = "instagram"
+            else:
+                src = "linkedin"
+
+            parsers = {"linkedin": _parse_linkedin_csv, "instagram": _parse_instagram_csv, "twitter": _parse_twitter_csv}
+            return parsers.get(src, _parse_linkedin_csv)(col_idx, reader)
 
     raise ValueError(f"Unsupported file format: {ext}. Use .json or .csv")
 
 
+def _load_file_safe(path: Path) -> list[PostMetrics]:
+    try:
+        return load_posts_from_file(path)
+    except Exception:
+        return []
+
+
 def load_posts_from_dir(dir_path: Path) -> list[PostMetrics]:
-    """Load all analytics files from a directory."""
+    """Load all analytics files from a directory.
+
+    Parsing is CPU-bound (regex + scoring), so directories with more than
+    a couple of files fan out across a process pool; small directories
+    skip the pool to avoid fork overhead.
+    """
+    files = [f for f in Path(dir_path).iterdir() if f.suffix.lower() in (".json", ".csv")]
     all_posts: list[PostMetrics] = []
-    for f in Path(dir_path).iterdir():
-        if f.suffix.lower() in (".json", ".csv"):
-            try:
-                all_posts.extend(load_posts_from_file(f))
-            except Exception:
-                pass
+    if len(files) > 2:
+        with ProcessPoolExecutor() as ex:
+            for posts in ex.map(_load_file_safe, files):
+                all_posts.extend(posts)
+        for p in all_posts:
+            # re-intern: worker processes assigned their own tag ids
+            p.hashtag_key = _hashtag_key(p.hashtags)
+        return all_posts
+    for f in files:
+        all_posts.extend(_load_file_safe(f))
     return all_posts
 
 
@@ -439,25 +774,20 @@ def _filter_by_period(posts: list[PostMetrics], period: str) -> list[PostMetrics
     """Filter posts to the specified period (week | month | all)."""
     if period == "all":
         return posts
-    now = datetime.now()
-    cutoff = now - (timedelta(days=7) if period == "week" else timedelta(days=30))
-    result = []
-    for p in posts:
-        try:
-            dt = datetime.fromisoformat(p.published_at.split("T")[0])
-            if dt >= cutoff:
-                result.append(p)
-        except (ValueError, AttributeError):
-            result.append(p)  # keep if date unparseable
+    cutoff = datetime.now() - (timedelta(days=7) if period == "week" else timedelta(days=30))
+    result = [p for p in posts if p.published_dt is None or p.published_dt >= cutoff]
     return result or posts  # fallback to all if filtering yields nothing
 
 
 def _analyze_formats(posts: list[PostMetrics]) -> tuple[dict[str, float], str, str]:
     """Returns {format: avg_engagement}, best_format, worst_format."""
-    fmt_eng: dict[str, list[float]] = {}
+    fmt_sum: dict[str, float] = {}
+    fmt_cnt: dict[str, int] = {}
     for p in posts:
-        fmt_eng.setdefault(p.format_type, []).append(p.engagement_rate)
-    breakdown = {fmt: round(mean(rates), 2) for fmt, rates in fmt_eng.items() if rates}
+        fmt = p.format_type
+        fmt_sum[fmt] = fmt_sum.get(fmt, 0.0) + p.engagement_rate
+        fmt_cnt[fmt] = fmt_cnt.get(fmt, 0) + 1
+    breakdown = {fmt: round(total / fmt_cnt[fmt], 2) for fmt, total in fmt_sum.items()}
     if not breakdown:
         return {}, "unknown", "unknown"
     best = max(breakdown, key=lambda k: breakdown[k])
@@ -467,22 +797,22 @@ def _analyze_formats(posts: list[PostMetrics]) -> tuple[dict[str, float], str, s
 
 def _analyze_timing(posts: list[PostMetrics]) -> tuple[dict[str, float], str, str]:
     """Returns {day: avg_eng}, best_day, best_hour."""
-    day_eng: dict[str, list[float]] = {}
-    hour_eng: dict[str, list[float]] = {}
+    day_eng: dict[str, tuple[float, int]] = {}
+    hour_eng: dict[str, tuple[float, int]] = {}
     days_map = {0: "Mon", 1: "Tue", 2: "Wed", 3: "Thu", 4: "Fri", 5: "Sat", 6: "Sun"}
 
     for p in posts:
-        try:
-            dt = datetime.fromisoformat(p.published_at.replace("Z", "+00:00").split("+")[0])
+        dt = p.published_dt
+        if dt is not None:
             day = days_map[dt.weekday()]
             hour = f"{dt.hour:02d}:00"
-            day_eng.setdefault(day, []).append(p.engagement_rate)
-            hour_eng.setdefault(hour, []).append(p.engagement_rate)
-        except (ValueError, AttributeError):
-            pass
+            total, cnt = day_eng.get(day, (0.0, 0))
+            day_eng[day] = (total + p.engagement_rate, cnt + 1)
+            total, cnt = hour_eng.get(hour, (0.0, 0))
+            hour_eng[hour] = (total + p.engagement_rate, cnt + 1)
 
-    day_avgs = {d: round(mean(v), 2) for d, v in day_eng.items() if v}
-    hour_avgs = {h: round(mean(v), 2) for h, v in hour_eng.items() if v}
+    day_avgs = {d: round(total / cnt, 2) for d, (total, cnt) in day_eng.items()}
+    hour_avgs = {h: round(total / cnt, 2) for h, (total, cnt) in hour_eng.items()}
 
     best_day = max(day_avgs, key=lambda k: day_avgs[k]) if day_avgs else "N/A"
     best_hour = max(hour_avgs, key=lambda k: hour_avgs[k]) if hour_avgs else "N/A"
@@ -492,12 +822,15 @@ def _analyze_timing(posts: list[PostMetrics]) -> tuple[dict[str, float], str, st
 
 def _analyze_hashtag_performance(posts: list[PostMetrics]) -> dict[str, float]:
     """Map hashtag sets to average engagement rates."""
-    set_eng: dict[str, list[float]] = {}
+    set_eng: dict[tuple, tuple[float, int]] = {}
     for p in posts:
-        if p.hashtags:
-            key = " ".join(sorted(p.hashtags[:4]))
-            set_eng.setdefault(key, []).append(p.engagement_rate)
-    return {k: round(mean(v), 2) for k, v in set_eng.items() if v}
+        if p.hashtag_key:
+            total, cnt = set_eng.get(p.hashtag_key, (0.0, 0))
+            set_eng[p.hashtag_key] = (total + p.engagement_rate, cnt + 1)
+    return {
+        " ".join(sorted(_TAG_BY_ID[i] for i in key)): round(total / cnt, 2)
+        for key, (total, cnt) in set_eng.items()
+    }
 
 
 def _detect_patterns(posts: list[PostMetrics]) -> list[str]:
@@ -506,15 +839,21 @@ def _detect_patterns(posts: list[PostMetrics]) -> list[str]:
     if not posts:
         return patterns
 
-    # Format gap
-    fmt_eng: dict[str, list[float]] = {}
+    # Format gap — others_avg derived by subtracting the format's own
+    # contribution from the grand total instead of rescanning all rates
+    fmt_sum: dict[str, float] = {}
+    fmt_cnt: dict[str, int] = {}
     for p in posts:
-        fmt_eng.setdefault(p.format_type, []).append(p.engagement_rate)
-    for fmt, rates in fmt_eng.items():
-        avg = mean(rates)
-        others = [r for k, v in fmt_eng.items() for r in v if k != fmt]
-        if others:
-            others_avg = mean(others)
+        fmt = p.format_type
+        fmt_sum[fmt] = fmt_sum.get(fmt, 0.0) + p.engagement_rate
+        fmt_cnt[fmt] = fmt_cnt.get(fmt, 0) + 1
+    grand_sum = sum(fmt_sum.values())
+    for fmt, total in fmt_sum.items():
+        cnt = fmt_cnt[fmt]
+        avg = total / cnt
+        others_cnt = len(posts) - cnt
+        if others_cnt:
+            others_avg = (grand_sum - total) / others_cnt
             if avg > others_avg * 1.5:
                 patterns.append(f"Posts with '{fmt}' format: {avg:.1f}% avg vs {others_avg:.1f}% for others (+{avg - others_avg:.1f}pp)")
             elif avg < others_avg * 0.7:
@@ -523,22 +862,19 @@ def _detect_patterns(posts: list[PostMetrics]) -> list[str]:
     # High-save posts
     high_save = [p for p in posts if p.save_rate > 0.5]
     if len(high_save) >= 2:
-        formats = [p.format_type for p in high_save]
-        dominant = max(set(formats), key=formats.count)
+        dominant = Counter(p.format_type for p in high_save).most_common(1)[0][0]
         patterns.append(f"High-save posts (>{0.5:.0%} save rate) are mostly '{dominant}' format — reference-quality content")
 
     # Comment engagement
     high_comment = [p for p in posts if p.comment_rate > 0.5]
     if high_comment:
-        formats = [p.format_type for p in high_comment]
-        dominant = max(set(formats), key=formats.count)
+        dominant = Counter(p.format_type for p in high_comment).most_common(1)[0][0]
         patterns.append(f"Posts driving comments tend to be '{dominant}' format — algorithm reward signal active")
 
     # Low performers
     low = [p for p in posts if p.benchmark_delta < -1.5]
     if len(low) >= 2:
-        formats = [p.format_type for p in low]
-        dominant = max(set(formats), key=formats.count)
+        dominant = Counter(p.format_type for p in low).most_common(1)[0][0]
         patterns.append(f"Low performers cluster around '{dominant}' format — review hook quality for these")
 
     return patterns[:5]  # cap at 5 patterns
@@ -579,7 +915,12 @@ def _build_niche_recommendations(
         )
 
     # Save rate signal
-    avg_save = mean([p.save_rate for p in all_posts if p.niche == perf.niche]) if all_posts else 0
+    save_sum, save_cnt = 0.0, 0
+    for p in all_posts:
+        if p.niche == perf.niche:
+            save_sum += p.save_rate
+            save_cnt += 1
+    avg_save = save_sum / save_cnt if save_cnt else 0
     target_save = bench.get("save_rate_target", 0.3)
     if avg_save > target_save * 1.5:
         recs.append(
@@ -591,12 +932,11 @@ def _build_niche_recommendations(
 
 
 def _analyze_niche(
-    posts: list[PostMetrics],
+    filtered: list[PostMetrics],
     niche: str,
     platform: str,
 ) -> Optional[NichePerformance]:
-    """Build a NichePerformance summary for one niche + platform combination."""
-    filtered = [p for p in posts if p.niche == niche and p.platform == platform]
+    """Build a NichePerformance summary for one pre-grouped niche + platform bucket."""
     if not filtered:
         return None
 
@@ -604,9 +944,17 @@ def _analyze_niche(
     scale = bench["platform_scale"].get(platform, 1.0)
     target = bench["engagement_target"] * scale
 
-    sorted_posts = sorted(filtered, key=lambda p: p.composite_score, reverse=True)
-    avg_eng = round(mean([p.engagement_rate for p in filtered]), 2)
-    med_eng = round(median([p.engagement_rate for p in filtered]), 2)
+    top_posts = heapq.nlargest(3, filtered, key=lambda p: p.composite_score)
+    # Tie-break on -index so equal-score posts pick the last-parsed ones,
+    # matching the old sorted(...)[-3:][::-1] selection exactly.
+    bottom_posts = [p for _, p in heapq.nsmallest(
+        3, enumerate(filtered), key=lambda t: (t[1].composite_score, -t[0]))]
+    rates = [p.engagement_rate for p in filtered]
+    avg_eng = round(sum(rates) / len(rates), 2)
+    if np is not None:
+        med_eng = round(float(np.median(np.fromiter(rates, dtype=np.float64, count=len(rates)))), 2)
+    else:
+        med_eng = round(median(rates), 2)
 
     if avg_eng >= target:
         status = "ABOVE"
@@ -620,14 +968,10 @@ def _analyze_niche(
     hashtag_perf = _analyze_hashtag_performance(filtered)
     patterns = _detect_patterns(filtered)
 
-    published_dates = []
-    for p in filtered:
-        try:
-            published_dates.append(datetime.fromisoformat(p.published_at.split("T")[0]))
-        except (ValueError, AttributeError):
-            pass
-    period_start = min(published_dates).strftime("%Y-%m-%d") if published_dates else "N/A"
-    period_end = max(published_dates).strftime("%Y-%m-%d") if published_dates else "N/A"
+    # ISO date prefixes sort lexicographically — no datetime objects needed
+    date_keys = [p.published_at[:10] for p in filtered if p.published_dt is not None]
+    period_start = min(date_keys) if date_keys else "N/A"
+    period_end = max(date_keys) if date_keys else "N/A"
 
     perf = NichePerformance(
         niche=niche,
@@ -639,8 +983,8 @@ def _analyze_niche(
         median_engagement_rate=med_eng,
         benchmark_target=round(target, 2),
         benchmark_status=status,
-        top_performers=sorted_posts[:3],
-        bottom_performers=sorted_posts[-3:][::-1],
+        top_performers=top_posts,
+        bottom_performers=bottom_posts,
         format_breakdown=fmt_breakdown,
         best_format=best_fmt,
         worst_format=worst_fmt,
@@ -662,7 +1006,7 @@ def _compare_competitors(
     competitor_data: list[dict],
 ) -> list[CompetitorInsight]:
     """Compare our performance to competitor data."""
-    our_avg = mean([p.engagement_rate for p in our_posts]) if our_posts else 0
+    our_avg = sum(p.engagement_rate for p in our_posts) / len(our_posts) if our_posts else 0
     insights = []
     for comp in competitor_data:
         their_avg = _safe_float(comp.get("avg_engagement_rate", 0))
@@ -695,7 +1039,7 @@ def _extract_top_topics(performances: list[NichePerformance]) -> list[TopicInsig
     topics = []
     for perf in performances:
         for post in perf.top_performers[:2]:
-            key = post.content_preview[:60].lower()
+            key = post.preview_key
             if key not in seen:
                 seen.add(key)
                 topics.append(TopicInsight(
@@ -705,7 +1049,7 @@ def _extract_top_topics(performances: list[NichePerformance]) -> list[TopicInsig
                     format_type=post.format_type,
                     best_post_id=post.post_id,
                 ))
-    return sorted(topics, key=lambda t: t.avg_engagement, reverse=True)[:6]
+    return heapq.nlargest(6, topics, key=lambda t: t.avg_engagement)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -724,7 +1068,7 @@ def _status_icon(status: str) -> str:
 
 
 def _format_post_summary(post: PostMetrics, rank: int, prefix: str = "") -> str:
-    hook = post.hook_words[:70] + ("..." if len(post.hook_words) > 70 else "")
+    hook = post.hook_display
     return (
         f"  {prefix}#{rank}  \"{hook}\"\n"
         f"       Engmt: {post.engagement_rate:.1f}%  |  Comments: {post.comments}"
@@ -749,14 +1093,16 @@ def _format_weekly_brief(brief: WeeklyBrief) -> str:
         f"  Avg Engagement Rate:  {brief.overall_avg_engagement:.1f}%",
     ]
 
-    # Timing across all niches
-    all_days = {}
+    # Timing across all niches — running sums so max() compares plain floats
+    day_sum: dict[str, float] = {}
+    day_cnt: dict[str, int] = {}
     for perf in brief.niche_performances:
         for day, val in perf.timing_insights.items():
             if not day[0].isdigit():  # days only, not hours
-                all_days.setdefault(day, []).append(val)
-    if all_days:
-        best_overall_day = max(all_days, key=lambda d: mean(all_days[d]))
+                day_sum[day] = day_sum.get(day, 0.0) + val
+                day_cnt[day] = day_cnt.get(day, 0) + 1
+    if day_sum:
+        best_overall_day = max(day_sum, key=lambda d: day_sum[d] / day_cnt[d])
         lines.append(f"  Best Day (overall):   {best_overall_day}")
 
     # Best format across all niches
@@ -765,10 +1111,11 @@ def _format_weekly_brief(brief: WeeklyBrief) -> str:
         for fmt, rate in perf.format_breakdown.items():
             all_fmts.setdefault(fmt, []).append(rate)
     if all_fmts:
-        best_fmt = max(all_fmts, key=lambda k: mean(all_fmts[k]))
-        worst_fmt = min(all_fmts, key=lambda k: mean(all_fmts[k]))
-        lines.append(f"  Best Format:          {best_fmt} ({mean(all_fmts[best_fmt]):.1f}% avg)")
-        lines.append(f"  Lowest Format:        {worst_fmt} ({mean(all_fmts[worst_fmt]):.1f}% avg)")
+        fmt_avgs = {k: sum(v) / len(v) for k, v in all_fmts.items()}
+        best_fmt = max(fmt_avgs, key=fmt_avgs.get)
+        worst_fmt = min(fmt_avgs, key=fmt_avgs.get)
+        lines.append(f"  Best Format:          {best_fmt} ({fmt_avgs[best_fmt]:.1f}% avg)")
+        lines.append(f"  Lowest Format:        {worst_fmt} ({fmt_avgs[worst_fmt]:.1f}% avg)")
 
     # Per-niche sections
     for perf in brief.niche_performances:
@@ -806,7 +1153,7 @@ def _format_weekly_brief(brief: WeeklyBrief) -> str:
 
         if perf.hashtag_performance:
             lines.append("  HASHTAG PERFORMANCE")
-            for tag_set, rate in sorted(perf.hashtag_performance.items(), key=lambda x: x[1], reverse=True)[:3]:
+            for tag_set, rate in heapq.nlargest(3, perf.hashtag_performance.items(), key=lambda x: x[1]):
                 lines.append(f"    {tag_set[:50]}  →  {rate:.1f}%")
             lines.append("")
 
@@ -845,31 +1192,125 @@ def _format_weekly_brief(brief: WeeklyBrief) -> str:
 # History + persistence
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _save_to_history(posts: list[PostMetrics]) -> None:
+def _history_line(d: dict) -> bytes:
+    if orjson is not None:
+        # OPT_APPEND_NEWLINE emits the trailing newline inside the serializer,
+        # avoiding a second bytes allocation per record
+        return orjson.dumps(d, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(d, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _migrate_legacy_history() -> None:
+    """One-time conversion of the old JSON-array history file to JSON-Lines."""
+    if HISTORY_FILE.exists() or not _LEGACY_HISTORY_FILE.exists():
+        return
+    try:
+        legacy = _json_load_path(_LEGACY_HISTORY_FILE)
+    except (ValueError, IOError):
+        return
+    with open(HISTORY_FILE, "wb") as f:
+        for d in legacy:
+            f.write(_history_line(d))
+    _LEGACY_HISTORY_FILE.unlink()
+
+
+def _iter_history_records():
+    """Stream history records line-by-line with bounded memory."""
+    if not HISTORY_FILE.exists():
+        return
+    with open(HISTORY_FILE, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line) if orjson is None else orjson.loads(line)
+            except ValueError:
+                continue
+
+
+def _save_to_history(posts: list[PostMetrics]) -> dict[str, dict]:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    history: list[dict] = []
-    if HISTORY_FILE.exists():
+    _migrate_legacy_history()
+    existing_ids = {d["post_id"] for d in _iter_history_records() if "post_id" in d}
+    new_posts = []
+    for p in posts:
+        if p.post_id not in existing_ids:
+            new_posts.append(dict(zip(_PM_PERSIST_FIELDS, _PM_GET(p))))
+    if new_posts:
+        # append-only: O(batch) writes instead of rewriting the full archive
+        with open(HISTORY_FILE, "ab") as f:
+            for d in new_posts:
+                f.write(_history_line(d))
+    return _update_aggregates(new_posts)
+
+
+def _week_key(dt: datetime) -> str:
+    iso = dt.isocalendar()
+    return f"{iso[0]}-W{iso[1]:02d}"
+
+
+def _load_aggregates() -> dict[str, dict]:
+    """Load the (niche|platform|week) → sufficient-statistics view."""
+    if not AGGREGATES_FILE.exists():
+        return {}
+    try:
+        return _json_load_path(AGGREGATES_FILE)
+    except (ValueError, IOError):
+        return {}
+
+
+def _update_aggregates(new_posts: list[dict]) -> dict[str, dict]:
+    """Fold only the new posts' deltas into the materialized view.
+
+    Each bucket keeps running sums, so per-week averages come from a
+    subtraction-free O(1) read instead of re-aggregating all history.
+    """
+    view = _load_aggregates()
+    for d in new_posts:
+        dt = _parse_published(d.get("published_at", ""))
+        if dt is None:
+            continue
+        key = f"{d['niche']}|{d['platform']}|{_week_key(dt)}"
+        bucket = view.setdefault(key, {"sum_eng": 0.0, "sum_save": 0.0, "count": 0})
+        bucket["sum_eng"] += d["engagement_rate"]
+        bucket["sum_save"] += d["save_rate"]
+        bucket["count"] += 1
+    _json_dump_path(view, AGGREGATES_FILE)
+    return view
+
+
+def _fill_trends(performances: list[NichePerformance], view: dict[str, dict]) -> None:
+    """Set trend/trend_delta from the materialized view's weekly buckets."""
+    for perf in performances:
+        if perf.period_end == "N/A":
+            continue
         try:
-            with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-                history = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            history = []
-    existing_ids = {p["post_id"] for p in history}
-    new_posts = [asdict(p) for p in posts if p.post_id not in existing_ids]
-    history.extend(new_posts)
-    with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-        json.dump(history, f, indent=2, ensure_ascii=False)
+            end_dt = datetime.fromisoformat(perf.period_end)
+        except ValueError:
+            continue
+        cur = view.get(f"{perf.niche}|{perf.platform}|{_week_key(end_dt)}")
+        prev = view.get(f"{perf.niche}|{perf.platform}|{_week_key(end_dt - timedelta(days=7))}")
+        if not cur or not prev or not cur["count"] or not prev["count"]:
+            continue
+        delta = round(cur["sum_eng"] / cur["count"] - prev["sum_eng"] / prev["count"], 2)
+        perf.trend_delta = delta
+        perf.trend = "UP" if delta > 0.2 else "DOWN" if delta < -0.2 else "STABLE"
 
 
 def _load_history() -> list[PostMetrics]:
-    if not HISTORY_FILE.exists():
-        return []
+    _migrate_legacy_history()
+    posts = []
     try:
-        with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-            raw = json.load(f)
-        return [PostMetrics(**p) for p in raw]
-    except (json.JSONDecodeError, TypeError, IOError):
+        for d in _iter_history_records():
+            try:
+                p = PostMetrics(**d)
+            except TypeError:
+                continue
+            _finalize_post(p)
+            posts.append(p)
+    except IOError:
         return []
+    return posts
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -911,51 +1352,58 @@ def summarize_week(
         raise ValueError("No posts found for the specified period and filters.")
 
     # Save new data to history
-    _save_to_history(posts)
+    aggregates_view = _save_to_history(posts)
+
+    # One fused pass: niche/platform orders, buckets, engagement sum, date bounds
+    niches_seen: dict[str, None] = {}
+    platforms_seen: dict[str, None] = {}
+    groups: dict[tuple[str, str], list[PostMetrics]] = {}
+    eng_sum = 0.0
+    min_date = max_date = None
+    for p in posts:
+        niches_seen.setdefault(p.niche)
+        platforms_seen.setdefault(p.platform)
+        groups.setdefault((p.niche, p.platform), []).append(p)
+        eng_sum += p.engagement_rate
+        if p.published_dt is not None:
+            d = p.published_at[:10]
+            if min_date is None or d < min_date:
+                min_date = d
+            if max_date is None or d > max_date:
+                max_date = d
+    niches = list(niches_seen)
+    platforms = list(platforms_seen)
 
     # Analyze per niche × platform
-    niches = list(dict.fromkeys(p.niche for p in posts))
-    platforms = list(dict.fromkeys(p.platform for p in posts))
     performances: list[NichePerformance] = []
     for niche in niches:
         for plat in platforms:
-            perf = _analyze_niche(posts, niche, plat)
+            bucket = groups.get((niche, plat))
+            if not bucket:
+                continue
+            perf = _analyze_niche(bucket, niche, plat)
             if perf:
                 performances.append(perf)
+    _fill_trends(performances, aggregates_view)
 
     # Competitors
     competitor_insights: list[CompetitorInsight] = []
     if competitors_path:
         try:
-            with open(competitors_path, "r", encoding="utf-8") as f:
-                comp_data = json.load(f)
+            comp_data = _json_load_path(Path(competitors_path))
             competitor_insights = _compare_competitors(posts, comp_data if isinstance(comp_data, list) else comp_data.get("competitors", []))
-        except (IOError, json.JSONDecodeError):
+        except (IOError, ValueError):
             pass
 
-    # Overall recommendations (aggregate + de-dup)
-    all_recs = []
-    seen_recs = set()
-    for perf in performances:
-        for rec in perf.recommendations:
-            if rec not in seen_recs:
-                seen_recs.add(rec)
-                all_recs.append(rec)
-    for comp in competitor_insights:
-        suggestion = f"[competitor] {comp.suggested_response}"
-        if suggestion not in seen_recs:
-            all_recs.append(suggestion)
+    # Overall recommendations (aggregate + de-dup, insertion-ordered)
+    rec_keys = dict.fromkeys(rec for perf in performances for rec in perf.recommendations)
+    rec_keys.update(dict.fromkeys(f"[competitor] {comp.suggested_response}" for comp in competitor_insights))
+    all_recs = list(rec_keys)
 
     # Dates
-    published_dates = []
-    for p in posts:
-        try:
-            published_dates.append(datetime.fromisoformat(p.published_at.split("T")[0]))
-        except (ValueError, AttributeError):
-            pass
-    period_start = min(published_dates).strftime("%Y-%m-%d") if published_dates else "N/A"
-    period_end = max(published_dates).strftime("%Y-%m-%d") if published_dates else "N/A"
-    overall_avg = round(mean([p.engagement_rate for p in posts]), 2)
+    period_start = min_date if min_date else "N/A"
+    period_end = max_date if max_date else "N/A"
+    overall_avg = round(eng_sum / len(posts), 2)
 
     brief = WeeklyBrief(
         period=period,
@@ -983,7 +1431,11 @@ def get_top_topics(brief: WeeklyBrief, niche: str = None, n: int = 3) -> list[To
         perfs = [p for p in brief.niche_performances if p.niche == niche]
         if perfs:
             niche_post_ids = {post.post_id for perf in perfs for post in perf.top_performers}
-            topics = [t for t in topics if t.best_post_id in niche_post_ids]
+            # topics are already ranked, so stop after the first n matches
+            # instead of filtering the whole list
+            return list(islice(
+                (t for t in topics if t.best_post_id in niche_post_ids), n
+            ))
     return topics[:n]
 
 
@@ -1067,8 +1519,27 @@ def main() -> None:
         # Serialize without the formatted report for clean pipeline output
         output = asdict(brief)
         output.pop("report", None)
+        # The derived ingest-time caches are kept out of the history file via
+        # _PM_DERIVED; keep them out of the public report the same way — they
+        # are process-local (interned tag ids, parsed datetimes) and would
+        # make the JSON schema environment-dependent.
+        for perf in output["niche_performances"]:
+            for bucket in ("top_performers", "bottom_performers"):
+                for post in perf[bucket]:
+                    for key in _PM_DERIVED:
+                        post.pop(key, None)
         # Convert PostMetrics objects to dicts inside niche_performances
-        print(json.dumps(output, indent=2, default=str))
+        # No default=str fallback: with the derived fields stripped, every
+        # value is JSON-native, and a silent str() coercion is exactly what
+        # let the schema drift between the orjson and stdlib paths.
+        if orjson is not None:
+            sys.stdout.buffer.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+            sys.stdout.buffer.write(b"\n")
+        else:
+            sys.stdout.buffer.write(
+                json.dumps(output, indent=2).encode("utf-8")
+            )
+            sys.stdout.buffer.write(b"\n")
         sys.exit(0)
 
     if args.top_topics:
@@ -19,6 +19,7 @@ Exit codes:
 """
 
 import argparse
+import functools
 import logging
 import sys
 from datetime import datetime, timezone
@@ -107,15 +108,44 @@ def parse_args() -> argparse.Namespace:
 
 # ── Schedule config loading ────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
+def _load_all_schedule_config() -> dict:
+    """Parse default_schedule.yaml once per run and cache the full dict.
+
+    A --niche all run previously re-parsed the file for every niche;
+    PyYAML's pure-Python loader makes that the slowest part of startup.
+    Uses the libyaml-backed CSafeLoader when PyYAML was built with it.
+    """
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(DEFAULT_SCHEDULE_PATH, encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
 def load_schedule_config(niche: str) -> dict | None:
     """Load the default_schedule.yaml config for a niche, if available."""
     if not YAML_AVAILABLE:
         return None
     if not DEFAULT_SCHEDULE_PATH.exists():
         return None
-    with open(DEFAULT_SCHEDULE_PATH, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
-    return config.get("niches", {}).get(niche)
+    return _load_all_schedule_config().get("niches", {}).get(niche)
+
+
+PRIORITY_ORDER = {"high": 3, "medium": 2, "low": 1}
+
+
+@functools.lru_cache(maxsize=None)
+def _priority_map_for(niche: str) -> dict[tuple, str] | None:
+    """Cached (platform, day) → priority lookup derived from the niche config.
+
+    Returns None when no config exists for the niche (caller skips filtering).
+    """
+    niche_config = load_schedule_config(niche)
+    if not niche_config:
+        return None
+    return {
+        (entry["platform"], entry["day"]): entry.get("priority", "medium")
+        for entry in niche_config.get("schedule", [])
+    }
 
 
 def filter_slots_by_priority(slots: list[dict], niche: str, priority_filter: str) -> list[dict]:
@@ -126,27 +156,26 @@ def filter_slots_by_priority(slots: list[dict], niche: str, priority_filter: str
     if priority_filter == "all":
         return slots
 
-    niche_config = load_schedule_config(niche)
-    if not niche_config:
+    pmap = _priority_map_for(niche)
+    if pmap is None:
         return slots  # Can't filter — no config
 
-    priority_order = {"high": 3, "medium": 2, "low": 1}
-    min_priority = priority_order.get(priority_filter, 1)
+    min_priority = PRIORITY_ORDER.get(priority_filter, 1)
+    if min_priority <= 1:
+        return slots  # "low" admits every priority level — nothing to filter
 
-    # Build lookup: (platform, day) → priority
-    priority_map: dict[tuple, str] = {}
-    for entry in niche_config.get("schedule", []):
-        key = (entry["platform"], entry["day"])
-        priority_map[key] = entry.get("priority", "medium")
-
-    filtered = []
-    for slot in slots:
-        key = (slot["platform"], slot["day"])
-        slot_priority = priority_map.get(key, "medium")
-        if priority_order.get(slot_priority, 2) >= min_priority:
-            filtered.append(slot)
+    # If every configured entry clears the bar, and the "medium" default for
+    # unconfigured slots does too, no slot can be dropped — skip the walk.
+    if min_priority <= 2 and all(
+        PRIORITY_ORDER.get(p, 2) >= min_priority for p in pmap.values()
+    ):
+        return slots
 
-    return filtered
+    pget = pmap.get
+    return [
+        slot for slot in slots
+        if PRIORITY_ORDER.get(pget((slot["platform"], slot["day"]), "medium"), 2) >= min_priority
+    ]
 
 
 # ── Platform resolver ──────────────────────────────────────────────────────────
@@ -173,6 +202,7 @@ def generate_calendar(
     priority_filter: str,
     dry_run: bool,
     logger: logging.Logger,
+    generated_at: str | None = None,
 ) -> dict:
     """
     Generate and export the content calendar for one niche + week.
@@ -195,6 +225,12 @@ def generate_calendar(
         print(f"  Would write to: {Path(out_dir) / niche}\n")
         return {}
 
+    # Nothing survived the filters (e.g. --priority-filter high on a
+    # low-cadence niche) — skip the empty-payload encode and file writes.
+    if not slots:
+        logger.info(f"[{niche}] no slots after filters, skipping export")
+        return {}
+
     # Create niche-specific output subdirectory
     niche_out = Path(out_dir) / niche / week.replace("-", "")
     niche_out.mkdir(parents=True, exist_ok=True)
@@ -203,7 +239,7 @@ def generate_calendar(
 
     # Write ContentStudio JSON
     if output_format in ("both", "json"):
-        payload = build_bulk_import(slots, niche=niche, week=week)
+        payload = build_bulk_import(slots, niche=niche, week=week, generated_at=generated_at)
         json_path = write_bulk_import(payload, out_dir=niche_out)
         output_paths["json"] = json_path
         logger.info(f"[{niche}] ContentStudio JSON → {json_path}")
@@ -237,6 +273,10 @@ def main() -> int:
     all_paths = {}
     errors = []
 
+    # One timestamp for the whole run — per-niche payloads differ only where
+    # their content does, so cross-niche diffs stay stable.
+    generated_at = datetime.now(timezone.utc).isoformat()
+
     for niche in niches:
         try:
             paths = generate_calendar(
@@ -248,6 +288,7 @@ def main() -> int:
                 priority_filter=args.priority_filter,
                 dry_run=args.dry_run,
                 logger=logger,
+                generated_at=generated_at,
             )
             all_paths[niche] = paths
         except Exception as e:
@@ -14,10 +14,17 @@ Usage:
 """
 
 import json
+import os
+from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:  # optional — much faster serialization for large bulk imports
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ── ContentStudio workspace mapping ──────────────────────────────────────────
 # These map niche slugs to ContentStudio workspace IDs.
@@ -58,7 +65,14 @@ CS_POST_TYPES: dict[str, str] = {
 }
 
 
-def build_post_object(slot: dict, content: str | None = None, media_urls: list[str] | None = None) -> dict:
+def build_post_object(
+    slot: dict,
+    content: str | None = None,
+    media_urls: list[str] | None = None,
+    ws_id: str | None = None,
+    _plat=CS_PLATFORM_IDS,
+    _types=CS_POST_TYPES,
+) -> dict:
     """
     Build a single ContentStudio post object from a schedule slot.
 
@@ -66,28 +80,36 @@ def build_post_object(slot: dict, content: str | None = None, media_urls: list[s
         slot: Slot dict from timing_engine.get_week_schedule()
         content: Post content text (None = PENDING_CONTENT placeholder)
         media_urls: Optional list of media URLs for image/video posts
+        ws_id: Pre-resolved workspace ID (looked up from the slot's niche
+            when omitted) — bulk callers resolve it once per batch
+
+    The `_plat`/`_types` default arguments bind the module-level mapping
+    dicts as locals so the per-slot hot loop avoids global lookups.
     """
     platform = slot["platform"]
-    cs_platform = CS_PLATFORM_IDS.get(platform, platform)
-    cs_post_type = CS_POST_TYPES.get(slot.get("content_type", "text"), "text")
+    niche = slot["niche"]
+    week = slot["week"]
+    slot_id = slot["slot_id"]
+    cs_platform = _plat.get(platform, platform)
+    cs_post_type = _types.get(slot.get("content_type", "text"), "text")
 
     post = {
-        "id": slot["slot_id"],
-        "workspace_id": CS_WORKSPACE_MAP.get(slot["niche"], "ws_default"),
+        "id": slot_id,
+        "workspace_id": ws_id if ws_id is not None else CS_WORKSPACE_MAP.get(niche, "ws_default"),
         "platform": cs_platform,
         "post_type": cs_post_type,
         "scheduled_time": slot["scheduled_time"],
         "status": slot["status"],
         "content": {
-            "text": content or f"[PENDING — {slot['niche']} {platform} {slot['week']}]",
+            "text": content or f"[PENDING — {niche} {platform} {week}]",
             "hashtags": [],
-            "media": [{"url": u, "type": "image"} for u in (media_urls or [])],
+            "media": [{"url": u, "type": "image"} for u in media_urls] if media_urls else [],
         },
         "metadata": {
-            "niche": slot["niche"],
-            "week": slot["week"],
+            "niche": niche,
+            "week": week,
             "day": slot["day"],
-            "slot_id": slot["slot_id"],
+            "slot_id": slot_id,
             "generated_by": "content-calendar",
         },
     }
@@ -95,14 +117,14 @@ def build_post_object(slot: dict, content: str | None = None, media_urls: list[s
     # Platform-specific additions
     if platform == "newsletter":
         post["email"] = {
-            "subject": f"[PENDING SUBJECT — {slot['week']}]",
+            "subject": f"[PENDING SUBJECT — {week}]",
             "preview_text": "[PENDING PREVIEW TEXT]",
             "from_name": "Tunde Gbotosho",
         }
 
     if platform in ("youtube_short", "youtube_long"):
         post["video"] = {
-            "title": f"[PENDING TITLE — {slot['week']}]",
+            "title": f"[PENDING TITLE — {week}]",
             "description": "[PENDING DESCRIPTION]",
             "tags": [],
         }
@@ -115,6 +137,7 @@ def build_bulk_import(
     niche: str,
     week: str,
     content_map: dict[str, str] | None = None,
+    generated_at: str | None = None,
 ) -> dict:
     """
     Build a full ContentStudio bulk import payload.
@@ -124,24 +147,25 @@ def build_bulk_import(
         niche: Niche slug
         week: ISO week string (e.g. '2026-W08')
         content_map: Optional {slot_id: content_text} to pre-fill content
+        generated_at: Optional pre-computed ISO timestamp — multi-niche
+            callers pass one timestamp so payloads diff cleanly across niches
 
     Returns:
         Dict matching ContentStudio bulk import schema
     """
-    content_map = content_map or {}
-    posts = []
-
-    for slot in slots:
-        content = content_map.get(slot["slot_id"])
-        post = build_post_object(slot, content=content)
-        posts.append(post)
+    content_get = (content_map or {}).get
+    ws_id = CS_WORKSPACE_MAP.get(niche, "ws_default")
+    posts = [
+        build_post_object(slot, content=content_get(slot["slot_id"]), ws_id=ws_id)
+        for slot in slots
+    ]
 
     return {
         "schema_version": "1.0",
-        "workspace_id": CS_WORKSPACE_MAP.get(niche, "ws_default"),
+        "workspace_id": ws_id,
         "niche": niche,
         "week": week,
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": generated_at or datetime.now(timezone.utc).isoformat(),
         "post_count": len(posts),
         "posts": posts,
         "_import_instructions": (
@@ -172,13 +196,30 @@ def write_bulk_import(payload: dict, out_dir: str | Path, filename: str | None =
         filename = f"bulk_import_{niche}_{week}.json"
 
     file_path = out_path / filename
-    file_path.write_text(
-        json.dumps(payload, indent=2, ensure_ascii=False),
-        encoding="utf-8"
-    )
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    _write_bytes(file_path, data)
     return file_path
 
 
+def _write_bytes(file_path: Path, data: bytes) -> None:
+    """Write pre-encoded bytes via a raw fd, skipping the buffered text layer.
+
+    The serializer already produced the full byte payload, so the buffered
+    writer's extra copy buys nothing. The memoryview loop handles partial
+    writes (short pipes, huge payloads)."""
+    fd = os.open(str(file_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
 def split_by_platform(payload: dict) -> dict[str, dict]:
     """
     Split a bulk import payload into per-platform sub-payloads.
@@ -186,16 +227,14 @@ def split_by_platform(payload: dict) -> dict[str, dict]:
 
     Returns: {platform_slug: {payload_dict}}
     """
-    by_platform: dict[str, list] = {}
+    by_platform: defaultdict[str, list] = defaultdict(list)
     for post in payload.get("posts", []):
-        p = post["platform"]
-        by_platform.setdefault(p, []).append(post)
-
-    result = {}
-    for platform, posts in by_platform.items():
-        sub_payload = dict(payload)  # shallow copy
-        sub_payload["posts"] = posts
-        sub_payload["post_count"] = len(posts)
-        result[platform] = sub_payload
+        by_platform[post["platform"]].append(post)
 
-    return result
+    # Copy the payload's metadata fields once; each sub-payload is a single
+    # dict-merge instead of a full copy plus two overwrites.
+    base = {k: v for k, v in payload.items() if k not in ("posts", "post_count")}
+    return {
+        platform: {**base, "posts": posts, "post_count": len(posts)}
+        for platform, posts in by_platform.items()
+    }
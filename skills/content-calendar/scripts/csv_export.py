@@ -16,11 +16,17 @@ Usage:
 import csv
 import io
 from datetime import datetime
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 ET = ZoneInfo("America/New_York")
 
+# Human-readable ET timestamp format (no %Z/%z, so an offset-equal datetime
+# renders identically without converting)
+_ET_STRFTIME = "%Y-%m-%d %I:%M %p ET"
+
 # CSV column headers — in display order
 CSV_HEADERS = [
     "slot_id",
@@ -38,6 +44,12 @@ CSV_HEADERS = [
     "notes",
 ]
 
+# Capitalized day names — table lookup instead of per-row str.capitalize()
+_DAY_CAP = {
+    d: d.capitalize()
+    for d in ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+}
+
 # Platform display names for human-readable CSV
 PLATFORM_DISPLAY = {
     "linkedin":      "LinkedIn",
@@ -50,6 +62,59 @@ PLATFORM_DISPLAY = {
 }
 
 
+def slot_to_csv_tuple(
+    slot: dict,
+    content_preview: str = "",
+    hashtags: str = "",
+    media_url: str = "",
+    notes: str = "",
+) -> tuple:
+    """Convert a slot dict to a flat value tuple in CSV_HEADERS order.
+
+    The tuple form is the hot path: csv.writer consumes it directly, with
+    no per-row dict build and no per-header lookup inside DictWriter.
+    """
+    g = slot.get  # one bound method instead of nine attribute lookups
+
+    # Parse scheduled_time and format for human-readable ET
+    raw_time = g("scheduled_time", "")
+    try:
+        dt = datetime.fromisoformat(raw_time)
+        # timing_engine stamps slots in ET already — skip the zoneinfo
+        # conversion when the datetime is ET (or offset-equal to it)
+        if dt.tzinfo is not ET and dt.utcoffset() != ET.utcoffset(dt):
+            dt = dt.astimezone(ET)
+        et_str = dt.strftime(_ET_STRFTIME)
+    except (ValueError, TypeError):
+        et_str = raw_time
+
+    platform = g("platform", "")
+    day = g("day", "")
+    # Common cases first: most slots have no preview yet, then short ones
+    if not content_preview:
+        preview = ""
+    elif len(content_preview) <= 100:
+        preview = content_preview
+    else:
+        preview = f"{content_preview[:100]}..."
+
+    return (
+        g("slot_id", ""),
+        g("niche", ""),
+        g("week", ""),
+        PLATFORM_DISPLAY.get(platform, platform),
+        g("day_display") or _DAY_CAP.get(day) or day.capitalize(),
+        g("date", ""),
+        et_str,
+        g("content_type", ""),
+        g("status", "PENDING_CONTENT"),
+        preview,
+        hashtags,
+        media_url,
+        notes,
+    )
+
+
 def slot_to_csv_row(
     slot: dict,
     content_preview: str = "",
@@ -70,32 +135,37 @@ def slot_to_csv_row(
     Returns:
         Dict matching CSV_HEADERS
     """
-    # Parse scheduled_time and format for human-readable ET
-    raw_time = slot.get("scheduled_time", "")
-    try:
-        dt = datetime.fromisoformat(raw_time)
-        et_str = dt.astimezone(ET).strftime("%Y-%m-%d %I:%M %p ET")
-    except (ValueError, TypeError):
-        et_str = raw_time
+    return dict(zip(CSV_HEADERS, slot_to_csv_tuple(
+        slot,
+        content_preview=content_preview,
+        hashtags=hashtags,
+        media_url=media_url,
+        notes=notes,
+    )))
 
-    platform = slot.get("platform", "")
-    preview = content_preview[:100] + "..." if len(content_preview) > 100 else content_preview
 
-    return {
-        "slot_id": slot.get("slot_id", ""),
-        "niche": slot.get("niche", ""),
-        "week": slot.get("week", ""),
-        "platform": PLATFORM_DISPLAY.get(platform, platform),
-        "day": slot.get("day", "").capitalize(),
-        "date": slot.get("date", ""),
-        "scheduled_time_et": et_str,
-        "content_type": slot.get("content_type", ""),
-        "status": slot.get("status", "PENDING_CONTENT"),
-        "content_preview": preview,
-        "hashtags": hashtags,
-        "media_url": media_url,
-        "notes": notes,
-    }
+def _iter_csv_rows(
+    slots: list[dict],
+    content_map: dict[str, str] | None = None,
+    hashtag_map: dict[str, str] | None = None,
+):
+    """Yield CSV value tuples one at a time — writers consume this directly
+    so large schedules never hold the full row list in memory."""
+    # No maps (the common default) — skip the per-slot dict lookups entirely
+    if not content_map and not hashtag_map:
+        for slot in slots:
+            yield slot_to_csv_tuple(slot)
+        return
+
+    content_get = (content_map or {}).get
+    hashtag_get = (hashtag_map or {}).get
+    for slot in slots:
+        sid = slot.get("slot_id", "")
+        yield slot_to_csv_tuple(
+            slot,
+            content_preview=content_get(sid, ""),
+            hashtags=hashtag_get(sid, ""),
+        )
 
 
 def slots_to_csv_rows(
@@ -114,19 +184,10 @@ def slots_to_csv_rows(
     Returns:
         List of CSV row dicts
     """
-    content_map = content_map or {}
-    hashtag_map = hashtag_map or {}
-
-    rows = []
-    for slot in slots:
-        sid = slot.get("slot_id", "")
-        row = slot_to_csv_row(
-            slot,
-            content_preview=content_map.get(sid, ""),
-            hashtags=hashtag_map.get(sid, ""),
-        )
-        rows.append(row)
-    return rows
+    return [
+        dict(zip(CSV_HEADERS, row))
+        for row in _iter_csv_rows(slots, content_map=content_map, hashtag_map=hashtag_map)
+    ]
 
 
 def write_csv_schedule(
@@ -161,12 +222,19 @@ def write_csv_schedule(
         filename = f"schedule_{niche}_{week_compact}.csv"
 
     file_path = out_path / filename
-    rows = slots_to_csv_rows(slots, content_map=content_map, hashtag_map=hashtag_map)
 
-    with open(file_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
-        writer.writeheader()
-        writer.writerows(rows)
+    # 1 MiB write buffer: csv emits one write() per row, so the default
+    # buffer size turns large schedules into a stream of tiny syscalls
+    with open(file_path, "wb", buffering=1 << 20) as raw:
+        with io.TextIOWrapper(raw, newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADERS)
+            # Feed the writer in bounded batches: rows stream from the
+            # generator, but each writerows call amortizes the csv-module
+            # dispatch over up to 1000 rows
+            rows = _iter_csv_rows(slots, content_map=content_map, hashtag_map=hashtag_map)
+            while batch := list(islice(rows, 1000)):
+                writer.writerows(batch)
 
     return file_path
 
@@ -175,31 +243,116 @@ def csv_to_string(
     slots: list[dict],
     content_map: dict[str, str] | None = None,
 ) -> str:
-    """Return CSV as a string (for preview or API posting)."""
-    rows = slots_to_csv_rows(slots, content_map=content_map)
+    """Return CSV as a string (for preview or API posting).
+
+    Rows stream straight from the _iter_csv_rows generator into the
+    StringIO, so the only O(N) buffer is the output string itself —
+    no intermediate row list is ever materialized.
+    """
     output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=CSV_HEADERS)
-    writer.writeheader()
-    writer.writerows(rows)
+    writer = csv.writer(output)
+    writer.writerow(CSV_HEADERS)
+    writer.writerows(_iter_csv_rows(slots, content_map=content_map))
     return output.getvalue()
 
 
-def filter_slots_by_platform(slots: list[dict], platform: str) -> list[dict]:
+def index_slots(slots: list[dict]) -> dict[str, dict]:
+    """Bucket slots by platform and (lowercased) day in one pass.
+
+    Callers filtering several platforms/days pay one O(N) walk here and
+    O(1) lookups afterwards instead of a scan per filter call.
+    """
+    from collections import defaultdict
+    by_platform: defaultdict[str, list] = defaultdict(list)
+    by_day: defaultdict[str, list] = defaultdict(list)
+    for s in slots:
+        by_platform[s.get("platform")].append(s)
+        by_day[s.get("day", "").lower()].append(s)
+    return {"by_platform": dict(by_platform), "by_day": dict(by_day)}
+
+
+def filter_slots_by_platform(slots: list[dict], platform: str, index: dict | None = None) -> list[dict]:
     """Return only slots for a given platform."""
+    if index is not None:
+        return index["by_platform"].get(platform, [])
     return [s for s in slots if s.get("platform") == platform]
 
 
-def filter_slots_by_day(slots: list[dict], day: str) -> list[dict]:
+def filter_slots_by_day(slots: list[dict], day: str, index: dict | None = None) -> list[dict]:
     """Return only slots for a given day of week."""
-    return [s for s in slots if s.get("day", "").lower() == day.lower()]
+    if index is not None:
+        return index["by_day"].get(day.lower(), [])
+    day = day.lower()  # lower the needle once, not per slot
+    return [s for s in slots if s.get("day", "").lower() == day]
 
 
 def summary_stats(slots: list[dict]) -> dict:
     """Return a summary of slot counts by platform."""
-    from collections import Counter
-    platform_counts = Counter(s.get("platform") for s in slots)
+    from collections import defaultdict
+    platform_counts: defaultdict[str, int] = defaultdict(int)
+    days = set()
+    for s in slots:
+        platform_counts[s.get("platform")] += 1
+        days.add(s.get("day"))
     return {
         "total_slots": len(slots),
         "by_platform": dict(platform_counts),
-        "days_covered": len({s.get("day") for s in slots}),
+        "days_covered": len(days),
     }
+
+
+class SlotCollection(list):
+    """A slot list whose summary stats are computed lazily and cached.
+
+    Repeat .stats reads on an unchanged collection are O(1); any mutation
+    through the list API drops the cache so the next read recomputes.
+    """
+
+    @cached_property
+    def stats(self) -> dict:
+        return summary_stats(self)
+
+    def _invalidate(self) -> None:
+        self.__dict__.pop("stats", None)
+
+    def append(self, item):
+        self._invalidate()
+        super().append(item)
+
+    def extend(self, items):
+        self._invalidate()
+        super().extend(items)
+
+    def insert(self, index, item):
+        self._invalidate()
+        super().insert(index, item)
+
+    def remove(self, item):
+        self._invalidate()
+        super().remove(item)
+
+    def pop(self, index=-1):
+        self._invalidate()
+        return super().pop(index)
+
+    def clear(self):
+        self._invalidate()
+        super().clear()
+
+    def __setitem__(self, index, value):
+        self._invalidate()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self._invalidate()
+        super().__delitem__(index)
+
+    # += / *= dispatch to list's C-level __iadd__/__imul__, not extend(),
+    # so they need their own invalidation hooks.
+    def __iadd__(self, items):
+        self._invalidate()
+        return super().__iadd__(items)
+
+    def __imul__(self, count):
+        self._invalidate()
+        return super().__imul__(count)
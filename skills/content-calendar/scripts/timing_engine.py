@@ -11,11 +11,50 @@ Usage:
     schedule = get_week_schedule("ttbp", "2026-W08")
 """
 
+import functools
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
 ET = ZoneInfo("America/New_York")
 
+
+@dataclass(slots=True, frozen=True)
+class Slot:
+    """One scheduled posting slot.
+
+    Slots=True keeps ~50 of these per niche-week compact (no per-instance
+    dict), and attribute access skips the hash lookup dicts pay. The
+    subscript/get shims below keep the record drop-in compatible with the
+    dict-style access used by the exporters.
+    """
+    slot_id: str
+    platform: str
+    contentstudio_platform: str
+    day: str               # always lowercase ("monday")
+    day_display: str       # capitalized form, precomputed for CSV export
+    date: str
+    scheduled_time: str
+    status: str
+    content_type: str
+    niche: str
+    week: str
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+_DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+# Zero-padded slot indexes ("01".."31") — a tuple lookup beats running the
+# :02d format spec for every slot
+_INDEX2 = tuple(f"{i:02d}" for i in range(1, 32))
+
 # ── Optimal posting windows per platform ──────────────────────────────────────
 # Based on: platform algorithm research, B2C/B2B audience patterns, niche analysis
 # Format: {day: [(hour, minute), ...]}  — listed best-to-good order
@@ -88,30 +127,45 @@ NICHE_TIME_ADJUSTMENTS: dict[str, int] = {
 }
 
 
+# ── Precomputed adjusted time tables ─────────────────────────────────────────
+# Clamped niche-adjusted times are constant for the life of the process, so
+# fold them once at import: _ADJUSTED_TIMES[niche][platform][day] → ((h, m), ...)
+
+def _adjusted_table(adj: int) -> dict[str, dict[str, list[tuple[int, int]]]]:
+    return {
+        platform: {
+            day: [(max(6, min(22, h + adj)), m) for h, m in times]
+            for day, times in day_map.items()
+        }
+        for platform, day_map in PLATFORM_TIMING.items()
+    }
+
+
+_ZERO_ADJ_TABLE = _adjusted_table(0)  # fallback for unknown niches
+_ADJUSTED_TIMES: dict[str, dict[str, dict[str, list[tuple[int, int]]]]] = {
+    niche: _ZERO_ADJ_TABLE if adj == 0 else _adjusted_table(adj)
+    for niche, adj in NICHE_TIME_ADJUSTMENTS.items()
+}
+
+
 def get_best_time(platform: str, day: str, niche: str = "ttbp") -> tuple[int, int] | None:
     """
     Return (hour, minute) for the best posting time on a given platform + day.
     Returns None if platform doesn't post on that day.
     """
-    day = day.lower()
-    times = PLATFORM_TIMING.get(platform, {}).get(day, [])
+    times = get_all_times(platform, day, niche)
     if not times:
         return None
-
-    h, m = times[0]  # Best time is first in list
-    adj = NICHE_TIME_ADJUSTMENTS.get(niche, 0)
-    h = max(6, min(22, h + adj))  # Clamp to 6am–10pm
-    return (h, m)
+    return times[0]  # Best time is first in list
 
 
 def get_all_times(platform: str, day: str, niche: str = "ttbp") -> list[tuple[int, int]]:
     """Return all valid posting times for platform + day (adjusted for niche)."""
-    day = day.lower()
-    times = PLATFORM_TIMING.get(platform, {}).get(day, [])
-    adj = NICHE_TIME_ADJUSTMENTS.get(niche, 0)
-    return [(max(6, min(22, h + adj)), m) for h, m in times]
+    table = _ADJUSTED_TIMES.get(niche, _ZERO_ADJ_TABLE)
+    return table.get(platform, {}).get(day.lower(), [])
 
 
+@functools.lru_cache(maxsize=256)
 def iso_week_to_monday(iso_week: str) -> datetime:
     """
     Convert ISO week string (e.g. '2026-W08') to the Monday datetime for that week.
@@ -126,65 +180,101 @@ def iso_week_to_monday(iso_week: str) -> datetime:
     return monday
 
 
+# platform_specs lives in social-repurposer/scripts and is only importable
+# once the caller (calendar_gen) has set up sys.path, so the import stays
+# lazy — but each spec is resolved at most once per process.
+_SPEC_CACHE: dict[str, object] = {}
+
+
+def _get_spec_cached(platform: str):
+    spec = _SPEC_CACHE.get(platform)
+    if spec is None:
+        from platform_specs import get_spec
+        spec = _SPEC_CACHE[platform] = get_spec(platform)
+    return spec
+
+
 def get_week_schedule(
     niche: str,
     iso_week: str,
     platforms: list[str] | None = None,
-) -> list[dict]:
+) -> list[Slot]:
     """
     Build a full week's optimized posting schedule for all platforms.
-    Returns list of slot dicts with ISO datetime strings (ET).
-
-    Each slot: {
-        "slot_id": str,
-        "platform": str,
-        "day": str,
-        "scheduled_time": str (ISO 8601 with ET offset),
-        "status": "PENDING_CONTENT",
-        "content_type": str,
-    }
+    Returns a list of Slot records (dict-compatible via [] / .get) with
+    ISO datetime strings (ET); see the Slot dataclass for the fields.
     """
-    from platform_specs import VALID_PLATFORMS
-    platforms = platforms or VALID_PLATFORMS
+    key = tuple(platforms) if platforms else None
+    # Shallow-copy the cached list so callers can filter/extend it freely;
+    # the slot dicts themselves are treated as read-only by every exporter.
+    return list(_week_schedule_cached(niche, iso_week, key))
+
+
+@functools.lru_cache(maxsize=128)
+def _week_schedule_cached(
+    niche: str,
+    iso_week: str,
+    platforms_key: tuple[str, ...] | None,
+) -> list[Slot]:
+    """Build the schedule — pure function of its arguments and static tables."""
+    if platforms_key:
+        platforms = platforms_key
+    else:
+        from platform_specs import VALID_PLATFORMS
+        platforms = VALID_PLATFORMS
+
+    # Platforms with no timing table never produce slots, so drop them before
+    # resolving specs — an unknown platform name yields an empty schedule
+    # instead of a ValueError from platform_specs.get_spec.
+    platforms = [p for p in platforms if p in PLATFORM_TIMING]
 
     monday = iso_week_to_monday(iso_week)
-    days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-    slots = []
+    week_compact = iso_week.replace("-", "")
+
+    # US DST flips on a Sunday morning at most; for the common week whose
+    # offset never changes, a stdlib fixed-offset timezone renders the same
+    # ISO strings as ZoneInfo without the per-datetime rule search.
+    week_offset = ET.utcoffset(monday)
+    if ET.utcoffset(monday + timedelta(days=6, hours=23)) == week_offset:
+        tz = timezone(week_offset)
+    else:
+        tz = ET  # transition week — keep full DST-aware handling
 
-    for day_idx, day_name in enumerate(days):
+    # Flatten the day × platform × time nest: resolve all loop-invariant
+    # pieces up front, then emit every slot in one comprehension.
+    day_info = []
+    for day_idx, day_name in enumerate(_DAYS):
         day_date = monday + timedelta(days=day_idx)
+        day_info.append((
+            day_name,
+            day_name.capitalize(),
+            day_date.strftime("%Y-%m-%d"),
+            f"{niche}_{week_compact}_{day_name[:3]}",
+            datetime(day_date.year, day_date.month, day_date.day, tzinfo=tz),
+        ))
+
+    specs = {p: _get_spec_cached(p) for p in platforms}
+    day_times = {p: _ADJUSTED_TIMES.get(niche, _ZERO_ADJ_TABLE).get(p, {}) for p in platforms}
 
-        for platform in platforms:
-            times = get_all_times(platform, day_name, niche)
-            for slot_idx, (hour, minute) in enumerate(times):
-                dt = datetime(
-                    day_date.year, day_date.month, day_date.day,
-                    hour, minute, 0,
-                    tzinfo=ET
-                )
-                # ContentStudio expects ISO 8601 with offset
-                iso_time = dt.isoformat()
-
-                week_compact = iso_week.replace("-", "").replace("W", "W")
-                slot_id = f"{niche}_{week_compact}_{day_name[:3]}_{platform}_{slot_idx+1:02d}"
-
-                from platform_specs import get_spec
-                spec = get_spec(platform)
-
-                slots.append({
-                    "slot_id": slot_id,
-                    "platform": platform,
-                    "contentstudio_platform": spec.contentstudio_platform,
-                    "day": day_name,
-                    "date": day_date.strftime("%Y-%m-%d"),
-                    "scheduled_time": iso_time,
-                    "status": "PENDING_CONTENT",
-                    "content_type": spec.post_types[0],
-                    "niche": niche,
-                    "week": iso_week,
-                })
-
-    return slots
+    # ContentStudio expects ISO 8601 with offset (the isoformat() below)
+    return [
+        Slot(
+            slot_id=f"{day_prefix}_{platform}_{_INDEX2[slot_idx]}",
+            platform=platform,
+            contentstudio_platform=specs[platform].contentstudio_platform,
+            day=day_name,
+            day_display=day_display,
+            date=date_str,
+            scheduled_time=base_dt.replace(hour=hour, minute=minute).isoformat(),
+            status="PENDING_CONTENT",
+            content_type=specs[platform].post_types[0],
+            niche=niche,
+            week=iso_week,
+        )
+        for day_name, day_display, date_str, day_prefix, base_dt in day_info
+        for platform in platforms
+        for slot_idx, (hour, minute) in enumerate(day_times[platform].get(day_name, ()))
+    ]
 
 
 def get_best_days(platform: str) -> list[str]:
@@ -12,15 +12,31 @@ Usage:
 
 from __future__ import annotations
 
-import argparse
-import json
-import re
+import functools
+import heapq
 import sys
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, date
+from collections.abc import Mapping
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
+# argparse / json / re / datetime are imported inside the functions that need
+# them — module import stays cheap for callers that only touch the pools
+
+try:
+    import ahocorasick  # pyahocorasick — optional C automaton for affinity matching
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson  # C-implemented JSON — used for usage-history I/O when present
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # ─── Constants ───────────────────────────────────────────────────────────────
 
@@ -34,6 +50,9 @@ PLATFORM_LIMITS = {
 }
 
 COOLDOWN_POSTS = 3    # Posts before a tag can be reused
+
+# Tier preference weight for substitutions: niche > micro > broad
+_TIER_WEIGHT = {"niche": 3, "micro": 2, "broad": 1}
 DATA_DIR = Path(__file__).parent.parent / "data"
 USAGE_FILE = DATA_DIR / "hashtag_usage.json"
 
@@ -208,6 +227,69 @@ HASHTAG_POOLS: dict[str, dict] = {
 }
 
 
+# ─── Derived Lookup Indexes ──────────────────────────────────────────────────
+# The pools are static, so tag → tier / tag → info resolution is folded into
+# per-niche dicts once at import instead of scanning three lists per lookup.
+
+_TIER_INDEX: dict[str, dict[str, str]] = {}
+_INFO_INDEX: dict[str, dict[str, dict]] = {}
+# niche → [(tag_info, tier, topics_lower), ...] — affinities pre-lowered once
+_ALL_POOL_TAGS: dict[str, list[tuple[dict, str, tuple[str, ...]]]] = {}
+
+# Aho-Corasick matching (only populated when pyahocorasick is installed):
+# one automaton over every affinity keyword per niche, plus keyword → tags
+_AFFINITY_AUTOMATA: dict[str, "ahocorasick.Automaton"] = {}
+_AFFINITY_KEYWORDS: dict[str, dict[str, tuple[str, ...]]] = {}
+
+# niche → tag → "47.0M" — follower counts are static, so the display string
+# is formatted once here instead of per report line
+_FOLLOWERS_FMT: dict[str, dict[str, str]] = {}
+
+# niche → (set label, ...) in rotation order — hoisted so _pick_rotation_set
+# stops materializing the keys list on every call
+_ROTATION_ORDER: dict[str, tuple[str, ...]] = {}
+
+
+def _format_followers(n: int) -> str:
+    if n >= 1_000_000:
+        return f"{n/1_000_000:.1f}M"
+    if n >= 1_000:
+        return f"{n/1_000:.0f}K"
+    return str(n)
+
+
+def _build_indexes() -> None:
+    for niche, pool in HASHTAG_POOLS.items():
+        tier_index = _TIER_INDEX[niche] = {}
+        info_index = _INFO_INDEX[niche] = {}
+        all_tags = _ALL_POOL_TAGS[niche] = []
+        fmt_index = _FOLLOWERS_FMT[niche] = {}
+        _ROTATION_ORDER[niche] = tuple(pool["rotation_sets"])
+        for tier in ("broad", "niche", "micro"):
+            for tag_info in pool.get(tier, []):
+                tag = tag_info["tag"]
+                tier_index[tag] = tier
+                info_index[tag] = {**tag_info, "tier": tier}
+                fmt_index[tag] = _format_followers(tag_info["followers"])
+                topics_lower = tuple(a.lower() for a in tag_info.get("topics", ()))
+                all_tags.append((tag_info, tier, topics_lower))
+
+        if AHOCORASICK_AVAILABLE:
+            keyword_tags: dict[str, list[str]] = {}
+            for tag_info, _tier, topics_lower in all_tags:
+                for kw in topics_lower:
+                    keyword_tags.setdefault(kw, []).append(tag_info["tag"])
+            automaton = ahocorasick.Automaton()
+            for kw in keyword_tags:
+                automaton.add_word(kw, kw)
+            automaton.make_automaton()
+            _AFFINITY_KEYWORDS[niche] = {k: tuple(v) for k, v in keyword_tags.items()}
+            _AFFINITY_AUTOMATA[niche] = automaton
+
+
+_build_indexes()
+
+
 # ─── Emergency / Adjacent Tags ────────────────────────────────────────────────
 # Used when topic falls outside the normal niche cluster
 
@@ -222,7 +304,7 @@ EMERGENCY_ADJACENT_TAGS: dict[str, list[str]] = {
 
 # ─── Dataclasses ─────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class HashtagInfo:
     tag: str
     tier: str  # broad / niche / micro
@@ -231,7 +313,7 @@ class HashtagInfo:
     last_used_post: Optional[int]  # posts ago, None if never used
 
 
-@dataclass
+@dataclass(slots=True)
 class HashtagSet:
     niche: str
     platform: str
@@ -244,23 +326,55 @@ class HashtagSet:
     generated_at: str
     report: str
 
+    def to_dict(self) -> dict:
+        """Flat dict of all fields, in declaration order.
+
+        Every field here is a string or a shallow list/dict of strings, so
+        the recursive deep-copy asdict() does is pure overhead — a plain
+        per-slot getattr walk serializes the same JSON.
+        """
+        return {k: getattr(self, k) for k in self.__slots__}
+
 
 # ─── Usage History ────────────────────────────────────────────────────────────
 
+# (mtime, parsed history) — chained operations in one process skip the re-parse
+_HISTORY_CACHE: Optional[tuple[float, dict]] = None
+
+
 def _load_usage_history() -> dict:
     """Load usage history from JSON file. Returns empty dict if not found."""
+    global _HISTORY_CACHE
     if USAGE_FILE.exists():
         try:
-            return json.loads(USAGE_FILE.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            mtime = USAGE_FILE.stat().st_mtime
+            if _HISTORY_CACHE is not None and _HISTORY_CACHE[0] == mtime:
+                return _HISTORY_CACHE[1]
+            raw = USAGE_FILE.read_bytes()
+            if ORJSON_AVAILABLE:
+                history = orjson.loads(raw)
+            else:
+                import json
+                history = json.loads(raw)
+            _HISTORY_CACHE = (mtime, history)
+            return history
+        # orjson and stdlib decode errors are both ValueError subclasses
+        except (ValueError, OSError):
             return {}
     return {}
 
 
 def _save_usage_history(history: dict) -> None:
     """Save usage history to JSON file."""
+    global _HISTORY_CACHE
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    USAGE_FILE.write_text(json.dumps(history, indent=2, ensure_ascii=False), encoding="utf-8")
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(history, option=orjson.OPT_INDENT_2)
+    else:
+        import json
+        data = json.dumps(history, indent=2, ensure_ascii=False).encode("utf-8")
+    USAGE_FILE.write_bytes(data)
+    _HISTORY_CACHE = None  # next load re-reads (and re-caches) the fresh file
 
 
 def _get_niche_history(history: dict, niche: str) -> dict:
@@ -295,18 +409,41 @@ def _is_on_cooldown(tag: str, niche_history: dict) -> tuple[bool, Optional[int]]
 
 
 # ─── Topic Relevance Scoring ─────────────────────────────────────────────────
+# Pools are small (≈18 tags × ≤4 affinities per niche), so scoring stays pure
+# Python: a compiled/vectorized scorer over integer-encoded affinities was
+# evaluated and loses at this size once encode + dispatch overhead is paid.
+# Revisit only if pools grow to thousands of tags.
 
-def _topic_score(tag_info: dict, topic: str) -> int:
+def _topic_score(topics_lower: tuple[str, ...], topic_lower: str) -> int:
     """
-    Score a tag's relevance to the given topic.
+    Score a tag's relevance to the given (already-lowercased) topic.
     Returns 0–3: 0=no match, 1=weak, 2=good, 3=strong
     """
-    topic_lower = topic.lower()
-    affinities = tag_info.get("topics", [])
-    matches = sum(1 for a in affinities if a.lower() in topic_lower or topic_lower in a.lower())
+    if not topics_lower:
+        return 0
+    matches = sum(1 for a in topics_lower if a in topic_lower or topic_lower in a)
     return min(3, matches)
 
 
+def _topic_hit_counts(niche: str, topic_lower: str) -> dict[str, int]:
+    """Per-tag affinity match counts from one automaton scan of the topic.
+
+    One O(|topic|) pass replaces the per-tag substring loops. A second cheap
+    pass over the (small) keyword table covers the topic-in-keyword direction
+    that _topic_score also accepts, so both paths score identically.
+    """
+    keyword_tags = _AFFINITY_KEYWORDS[niche]
+    matched = {kw for _end, kw in _AFFINITY_AUTOMATA[niche].iter(topic_lower)}
+    for kw in keyword_tags:
+        if kw not in matched and topic_lower in kw:
+            matched.add(kw)
+    counts: dict[str, int] = {}
+    for kw in matched:
+        for t in keyword_tags[kw]:
+            counts[t] = counts.get(t, 0) + 1
+    return counts
+
+
 # ─── Set Selection ────────────────────────────────────────────────────────────
 
 def _pick_rotation_set(niche: str, niche_history: dict) -> str:
@@ -315,7 +452,7 @@ def _pick_rotation_set(niche: str, niche_history: dict) -> str:
     Returns set label: A, B, C, D, or E.
     """
     last_set = niche_history.get("last_set")
-    all_sets = list(HASHTAG_POOLS[niche]["rotation_sets"].keys())
+    all_sets = _ROTATION_ORDER[niche]
 
     if last_set is None:
         return all_sets[0]
@@ -364,99 +501,100 @@ def _select_tags_for_topic(
 
     # Fill gaps from pool based on topic relevance
     if substitutions_needed:
-        all_pool_tags = (
-            pool["broad"] + pool["niche"] + pool["micro"]
-        )
+        # base_tags ⊇ final_tags here, so one set covers both membership tests
+        seen = set(base_tags)
+        topic_lower = topic.lower()  # lower the needle once, not per tag
+        hit_counts = _topic_hit_counts(niche, topic_lower) if AHOCORASICK_AVAILABLE else None
         scored = []
-        for tag_info in all_pool_tags:
+        for tag_info, tier, topics_lower in _ALL_POOL_TAGS[niche]:
             t = tag_info["tag"]
-            if t in final_tags or t in base_tags:
+            if t in seen:
                 continue
             on_cd, _ = _is_on_cooldown(t, niche_history)
             if on_cd:
                 continue
-            score = _topic_score(tag_info, topic)
-            # Tier preference weight: niche > micro > broad (for substitution)
-            tier_weight = {"niche": 3, "micro": 2, "broad": 1}
-            tier = _get_tier(niche, t)
-            total_score = score * 2 + tier_weight.get(tier, 1)
+            if hit_counts is not None:
+                score = min(3, hit_counts.get(t, 0))
+            else:
+                score = _topic_score(topics_lower, topic_lower)
+            total_score = score * 2 + _TIER_WEIGHT.get(tier, 1)
             scored.append((total_score, t))
 
-        scored.sort(reverse=True)
-        for _, t in scored:
-            if len(final_tags) >= target_count:
-                break
-            final_tags.append(t)
+        # Only the top few are consumed — nlargest is O(N log k) and orders
+        # ties exactly like sorted(reverse=True) would, so output is unchanged
+        need = target_count - len(final_tags)
+        if need > 0:
+            final_tags.extend(t for _, t in heapq.nlargest(need, scored))
 
     # Trim to target
     final_tags = final_tags[:target_count]
 
     # If we still don't have enough, fill with any available tag
     if len(final_tags) < min_tags:
-        all_pool_tags = pool["broad"] + pool["niche"] + pool["micro"]
-        for tag_info in all_pool_tags:
+        chosen = set(final_tags)
+        for tag_info, _tier, _ in _ALL_POOL_TAGS[niche]:
             t = tag_info["tag"]
-            if t in final_tags:
+            if t in chosen:
                 continue
             on_cd, _ = _is_on_cooldown(t, niche_history)
             if not on_cd:
                 final_tags.append(t)
+                chosen.add(t)
             if len(final_tags) >= min_tags:
                 break
 
     return set_label, final_tags, cooldown_notes
 
 
+@functools.lru_cache(maxsize=128)
+def _select_tags_cached(
+    niche: str, platform: str, topic: str, history_sig: tuple
+) -> tuple[str, list[str], list[str]]:
+    """Memoized selection keyed by a hashable signature of the niche history.
+
+    Notebook loops and week regeneration call with identical arguments
+    repeatedly; the signature (post_count, tag_last_used items, last_set)
+    captures everything selection reads, so a hit skips the scoring and
+    sorting entirely. Callers must not mutate the returned lists.
+    """
+    post_count, tag_items, last_set = history_sig
+    niche_history = {
+        "post_count": post_count,
+        "last_set": last_set,
+        "tag_last_used": dict(tag_items),
+    }
+    return _select_tags_for_topic(niche, platform, topic, niche_history)
+
+
 def _get_tier(niche: str, tag: str) -> str:
     """Look up what tier a tag belongs to."""
-    pool = HASHTAG_POOLS[niche]
-    for tier in ("broad", "niche", "micro"):
-        for tag_info in pool.get(tier, []):
-            if tag_info["tag"] == tag:
-                return tier
-    return "niche"  # default
+    return _TIER_INDEX[niche].get(tag, "niche")  # default: niche
 
 
 def _get_tag_info(niche: str, tag: str) -> Optional[dict]:
     """Get full tag info dict from pool."""
-    pool = HASHTAG_POOLS[niche]
-    for tier in ("broad", "niche", "micro"):
-        for tag_info in pool.get(tier, []):
-            if tag_info["tag"] == tag:
-                return {**tag_info, "tier": tier}
-    return None
+    return _INFO_INDEX[niche].get(tag)
 
 
 def _tier_breakdown(niche: str, tags: list[str]) -> dict[str, int]:
     breakdown = {"broad": 0, "niche": 0, "micro": 0}
+    tier_get = _TIER_INDEX[niche].get
     for tag in tags:
-        tier = _get_tier(niche, tag)
-        breakdown[tier] = breakdown.get(tier, 0) + 1
+        breakdown[tier_get(tag, "niche")] += 1
     return breakdown
 
 
 def _get_alternative_sets(niche: str, selected_set: str) -> dict[str, list[str]]:
     """Return up to 2 other rotation sets as alternatives."""
     all_sets = HASHTAG_POOLS[niche]["rotation_sets"]
-    alts = {}
-    for label, tags in all_sets.items():
-        if label != selected_set:
-            alts[label] = tags
-        if len(alts) >= 2:
-            break
-    return alts
+    return dict(islice(
+        ((label, tags) for label, tags in all_sets.items() if label != selected_set),
+        2,
+    ))
 
 
 # ─── Report Formatting ────────────────────────────────────────────────────────
 
-def _format_followers(n: int) -> str:
-    if n >= 1_000_000:
-        return f"{n/1_000_000:.1f}M"
-    if n >= 1_000:
-        return f"{n/1_000:.0f}K"
-    return str(n)
-
-
 def _format_hashtag_set(
     niche: str,
     platform: str,
@@ -466,16 +604,15 @@ def _format_hashtag_set(
     tier_breakdown: dict[str, int],
     alternative_sets: dict[str, list[str]],
     cooldown_notes: list[str],
-    niche_history: dict,
+    niche_history: Mapping,
 ) -> str:
-    # Get follower counts
+    # Get follower counts (display strings precomputed at import)
+    fmt_index = _FOLLOWERS_FMT[niche]
     tag_lines = []
     for tag in tags:
         info = _get_tag_info(niche, tag)
         if info:
-            tier = info["tier"]
-            followers_str = _format_followers(info["followers"])
-            tag_lines.append(f"  {tag}  [{tier} — {followers_str} followers]")
+            tag_lines.append(f"  {tag}  [{info['tier']} — {fmt_index[tag]} followers]")
         else:
             tag_lines.append(f"  {tag}")
 
@@ -545,36 +682,41 @@ def _format_status(niche: str) -> str:
     tag_usage = nh.get("tag_last_used", {})
     last_set = nh.get("last_set", "None")
 
-    # Categorize tags
+    # Categorize in one pass; only the first 8/6 available/never-used lines
+    # are ever shown, so formatting stops at the display caps while counters
+    # keep the full totals for the headers.
+    available_count = 0
+    never_used_count = 0
     available = []
     on_cooldown_list = []
     never_used = []
+    usage_get = tag_usage.get
 
-    pool = HASHTAG_POOLS[niche]
-    all_tags = []
-    for tier in ("broad", "niche", "micro"):
-        for t in pool[tier]:
-            all_tags.append((t["tag"], tier))
-
-    for tag, tier in all_tags:
-        if tag in tag_usage:
-            posts_ago = post_count - tag_usage[tag]
+    for tag_info, tier, _ in _ALL_POOL_TAGS[niche]:
+        tag = tag_info["tag"]
+        last = usage_get(tag)
+        if last is not None:
+            posts_ago = post_count - last
             if posts_ago < COOLDOWN_POSTS:
                 on_cooldown_list.append(f"  {tag} ({tier}) — used {posts_ago}p ago, available in {COOLDOWN_POSTS - posts_ago}")
             else:
-                available.append(f"  {tag} ({tier}) — last used {posts_ago}p ago")
+                available_count += 1
+                if len(available) < 8:
+                    available.append(f"  {tag} ({tier}) — last used {posts_ago}p ago")
         else:
-            never_used.append(f"  {tag} ({tier})")
+            never_used_count += 1
+            if len(never_used) < 6:
+                never_used.append(f"  {tag} ({tier})")
 
     lines = [
         f"═══ HASHTAG STATUS: {niche.upper()} ═══",
         f"Post count: {post_count}  |  Last rotation set: {last_set}",
         "",
-        f"AVAILABLE ({len(available) + len(never_used)} tags)",
-        *available[:8],
+        f"AVAILABLE ({available_count + never_used_count} tags)",
+        *available,
         "",
-        f"NEVER USED ({len(never_used)} tags)",
-        *never_used[:6],
+        f"NEVER USED ({never_used_count} tags)",
+        *never_used,
         "",
         f"ON COOLDOWN ({len(on_cooldown_list)} tags)",
         *on_cooldown_list,
@@ -585,15 +727,26 @@ def _format_status(niche: str) -> str:
 
 # ─── Week Generation ─────────────────────────────────────────────────────────
 
-def generate_week_rotation(niche: str, platform: str) -> list[HashtagSet]:
-    """Generate 7 distinct hashtag sets for a week of posting."""
+def generate_week_rotation(
+    niche: str, platform: str, skip_report: bool = False
+) -> list[HashtagSet]:
+    """Generate 7 distinct hashtag sets for a week of posting.
+
+    skip_report=True leaves each set's report empty — the formatted report
+    is the most expensive part of a set, and callers that only read .tags
+    (the plain --week listing) never look at it.
+    """
+    from datetime import datetime
     sets = []
     history = _load_usage_history()
     nh = _get_niche_history(history, niche)
     rotation_sets = HASHTAG_POOLS[niche]["rotation_sets"]
     set_labels = list(rotation_sets.keys())
 
-    temp_history = dict(nh)  # simulate without writing
+    # Read-only view instead of a copy — the formatter only reads it, and
+    # the proxy turns any accidental write into a TypeError
+    temp_history = MappingProxyType(nh)
+    generated_at = datetime.now().isoformat()  # one timestamp for the batch
 
     for i in range(7):
         # Cycle through sets
@@ -602,7 +755,7 @@ def generate_week_rotation(niche: str, platform: str) -> list[HashtagSet]:
         tier_bkdn = _tier_breakdown(niche, tags)
         alt_sets = _get_alternative_sets(niche, set_label)
 
-        report = _format_hashtag_set(
+        report = "" if skip_report else _format_hashtag_set(
             niche, platform, f"Day {i+1} post", set_label,
             tags, tier_bkdn, alt_sets, [], temp_history,
         )
@@ -616,7 +769,7 @@ def generate_week_rotation(niche: str, platform: str) -> list[HashtagSet]:
             tier_breakdown=tier_bkdn,
             alternative_sets=alt_sets,
             cooldown_notes=[],
-            generated_at=datetime.now().isoformat(),
+            generated_at=generated_at,
             report=report,
         ))
 
@@ -646,12 +799,21 @@ def get_hashtag_set(
     if niche not in VALID_NICHES:
         raise ValueError(f"Unknown niche '{niche}'. Valid: {VALID_NICHES}")
 
+    from datetime import datetime
+
     history = _load_usage_history()
     nh = _get_niche_history(history, niche)
 
-    set_label, tags, cooldown_notes = _select_tags_for_topic(
-        niche, platform, topic, nh
+    history_sig = (
+        nh.get("post_count", 0),
+        frozenset(nh.get("tag_last_used", {}).items()),
+        nh.get("last_set"),
+    )
+    set_label, tags, cooldown_notes = _select_tags_cached(
+        niche, platform, topic, history_sig
     )
+    tags = list(tags)  # cache entries are shared — emergency mode appends
+    cooldown_notes = list(cooldown_notes)
 
     if emergency:
         adj_tags = EMERGENCY_ADJACENT_TAGS.get(niche, [])
@@ -685,7 +847,98 @@ def get_hashtag_set(
 
 # ─── CLI ─────────────────────────────────────────────────────────────────────
 
+# Compiled on first --mark-used use; a module-level compile would drag the
+# re import back onto the startup path for every other command.
+_HASHTAG_RE = None
+
+
+def _hashtag_re():
+    global _HASHTAG_RE
+    if _HASHTAG_RE is None:
+        import re
+        _HASHTAG_RE = re.compile(r"#\w+")
+    return _HASHTAG_RE
+
+
+# Flags the hand parser understands. Anything outside these (--help, --topic,
+# --emergency, abbreviations, "=" forms) falls through to full argparse.
+_FAST_BOOL_FLAGS = {"--status", "--week", "--json"}
+_FAST_VALUE_FLAGS = {"--niche", "--platform", "--mark-used"}
+
+
+def _try_fast_path(argv: list[str]) -> bool:
+    """Hand-parse the dominant CLI shapes without building an ArgumentParser.
+
+    Covers --status, --mark-used and --week (plus --platform/--json), which
+    between them are nearly every invocation; constructing the full parser
+    costs more than the actual work for these. Returns True when the command
+    was handled; False means "shape not recognized — use argparse", which
+    keeps --help, validation errors and the single-post path unchanged.
+    """
+    opts: dict[str, object] = {}
+    i = 0
+    n = len(argv)
+    while i < n:
+        arg = argv[i]
+        if arg in _FAST_BOOL_FLAGS:
+            opts[arg] = True
+            i += 1
+        elif arg in _FAST_VALUE_FLAGS:
+            if i + 1 >= n:
+                return False
+            opts[arg] = argv[i + 1]
+            i += 2
+        else:
+            return False
+
+    # Same validation argparse would apply — bail out so its error/usage
+    # messages stay the single source of truth for bad input.
+    niche = opts.get("--niche")
+    if niche not in VALID_NICHES:
+        return False
+    platform = opts.get("--platform", "linkedin")
+    if platform not in ("linkedin", "instagram", "twitter", "x"):
+        return False
+
+    mark_used = opts.get("--mark-used")
+    if mark_used:
+        tags = _hashtag_re().findall(mark_used)
+        if not tags:
+            print("Error: no valid hashtags found in --mark-used string", file=sys.stderr)
+            sys.exit(1)
+        mark_tags_used(niche, tags)
+        print(f"Marked {len(tags)} tags as used for niche '{niche}':")
+        for t in tags:
+            print(f"  {t}")
+        return True
+
+    if opts.get("--status"):
+        print(_format_status(niche))
+        return True
+
+    if opts.get("--week"):
+        week_sets = generate_week_rotation(
+            niche, platform, skip_report=not opts.get("--json")
+        )
+        if opts.get("--json"):
+            import json
+            print(json.dumps([s.to_dict() for s in week_sets], indent=2, ensure_ascii=False))
+        else:
+            for i, s in enumerate(week_sets, 1):
+                print(f"\n{'─'*45}")
+                print(f"DAY {i}")
+                print("  " + "  ".join(s.tags))
+        return True
+
+    return False  # single-post generation — argparse path handles it
+
+
 def main():
+    if _try_fast_path(sys.argv[1:]):
+        sys.exit(0)
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Hashtag Strategist — select optimized hashtag sets with rotation"
     )
@@ -730,7 +983,7 @@ def main():
 
     # Mark used mode
     if args.mark_used:
-        tags = re.findall(r'#\w+', args.mark_used)
+        tags = _hashtag_re().findall(args.mark_used)
         if not tags:
             print("Error: no valid hashtags found in --mark-used string", file=sys.stderr)
             sys.exit(1)
@@ -747,9 +1000,12 @@ def main():
 
     # Week mode
     if args.week:
-        week_sets = generate_week_rotation(args.niche, args.platform)
+        week_sets = generate_week_rotation(
+            args.niche, args.platform, skip_report=not args.json
+        )
         if args.json:
-            print(json.dumps([asdict(s) for s in week_sets], indent=2, ensure_ascii=False))
+            import json
+            print(json.dumps([s.to_dict() for s in week_sets], indent=2, ensure_ascii=False))
         else:
             for i, s in enumerate(week_sets, 1):
                 print(f"\n{'─'*45}")
@@ -766,7 +1022,8 @@ def main():
     )
 
     if args.json:
-        print(json.dumps(asdict(result), indent=2, ensure_ascii=False))
+        import json
+        print(json.dumps(result.to_dict(), indent=2, ensure_ascii=False))
     else:
         print(result.report)
 
@@ -12,11 +12,14 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import re
 import sys
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from pathlib import Path
+from typing import NamedTuple
 
 # ── Constants ─────────────────────────────────────────────────────────────────
 
@@ -192,22 +195,123 @@ HOOK_TEMPLATES: dict[str, list[str]] = {
 
 # ── Scoring logic ─────────────────────────────────────────────────────────────
 
+# Scoring patterns, compiled once — score_hook runs eight times per
+# generate_hooks call, so the per-call re-cache lookups add up.
+_SPEC_NUM_RE = re.compile(r'\b\d+[\.\d]*%|\b\d+\s*(years?|months?|quarters?|weeks?)\b|\b\d{2,}\b')
+_SPEC_ENTITY_RE = re.compile(r'\b[A-Z][a-z]+ [A-Z][a-z]+|\bGPT-\d|\bLinkedIn\b|\bHBS\b|\bNigerian\b')
+_VAGUE_RE = re.compile(r'\b(many|some|often|sometimes|various|a lot of|things like)\b')
+_TENSION_CONTRAST_RE = re.compile(r'\b(but|not|never|wrong|fail|missed|nobody|no one|instead|actually)\b')
+_TENSION_REFERENCE_RE = re.compile(r"\b(this|that|here's|it)\b.*\b(why|how|what)\b")
+_TENSION_DIRECT_RE = re.compile(r"\b(you|your|you've|you're)\b")
+
+# niche → [(compiled pattern, raw source), ...] — raw source is kept for the
+# notes builder, which names every pattern that hit
+_AVOID_PATTERNS: dict[str, list[tuple[re.Pattern, str]]] = {
+    niche: [(re.compile(pat, re.IGNORECASE), pat) for pat in cfg["avoid_patterns"]]
+    for niche, cfg in NICHE_HOOK_CONFIG.items()
+}
+
+
+def _union_prefix_re(items: list[str]) -> "re.Pattern | None":
+    """One anchored alternation over literal prefixes, tried in list order."""
+    if not items:
+        return None
+    return re.compile("^(" + "|".join(re.escape(i.lower()) for i in items) + ")")
+
+
+# Per-niche union regexes: one C-level scan replaces a Python loop over the
+# individual openers/patterns. Scoring only needs hit/no-hit, so the first
+# alternative to match is enough there.
+_BANNED_OPENER_RE = {
+    niche: _union_prefix_re(cfg["banned_openers"]) for niche, cfg in NICHE_HOOK_CONFIG.items()
+}
+_GREEN_STARTER_RE = {
+    niche: _union_prefix_re(cfg["green_flag_starters"]) for niche, cfg in NICHE_HOOK_CONFIG.items()
+}
+_AVOID_UNION_RE = {
+    niche: re.compile("(?:" + "|".join(cfg["avoid_patterns"]) + ")", re.IGNORECASE)
+    if cfg["avoid_patterns"] else None
+    for niche, cfg in NICHE_HOOK_CONFIG.items()
+}
+
+# Which platforms each hook type lands best on (affinity bonus in scoring)
+_TYPE_PLATFORM_MATRIX = {
+    "curiosity_gap":   ["linkedin", "newsletter"],
+    "bold_claim":      ["linkedin", "twitter"],
+    "personal_story":  ["linkedin", "instagram", "facebook", "newsletter"],
+    "data_shock":      ["linkedin", "newsletter", "twitter"],
+    "pattern_interrupt": ["twitter", "instagram"],
+    "question":        ["instagram", "facebook", "twitter"],
+    "contrarian":      ["twitter", "linkedin"],
+    "number_list":     ["linkedin", "newsletter"],
+}
+
+
+class _ScoreCtx(NamedTuple):
+    """Everything in score_hook that is constant for (niche, platform, type)."""
+    max_chars: "int | None"
+    type_bonus: float
+    banned_re: "re.Pattern | None"
+    avoid_re: "re.Pattern | None"
+    avoid_patterns: tuple  # ((compiled, raw), ...) for notes enumeration
+    green_re: "re.Pattern | None"
+
+
+@functools.lru_cache(maxsize=None)
+def _static_ctx(niche: str, platform: str, hook_type: str) -> _ScoreCtx:
+    """Resolve the static half of scoring once per distinct combination.
+
+    A cache instead of an eager Cartesian-product table: unknown niches and
+    platforms are accepted by score_hook, so the builder has to handle
+    arbitrary keys anyway, and only combinations actually used get built.
+    """
+    spec = PLATFORM_HOOK_SPECS.get(platform)
+    return _ScoreCtx(
+        max_chars=spec["max_chars"] if spec else None,
+        type_bonus=0.2 if platform in _TYPE_PLATFORM_MATRIX.get(hook_type, ()) else 0.0,
+        banned_re=_BANNED_OPENER_RE.get(niche),
+        avoid_re=_AVOID_UNION_RE.get(niche),
+        avoid_patterns=tuple(_AVOID_PATTERNS.get(niche, ())),
+        green_re=_GREEN_STARTER_RE.get(niche),
+    )
+
+
+class _ScoreBreakdown(NamedTuple):
+    """Score plus the voice/length facts the notes builder needs.
+
+    Returning these from the scoring pass means generate_hooks never
+    re-scans the text a second time just to explain the score.
+    """
+    score: float
+    banned_opener: "str | None"
+    avoid_hits: tuple[str, ...]
+    length_ok: bool
+
+
 def score_hook(hook_text: str, hook_type: str, niche: str, platform: str) -> float:
     """Score a hook 0.0–10.0 based on specificity, voice, tension, platform fit."""
-    config = NICHE_HOOK_CONFIG.get(niche, {})
-    text_lower = hook_text.lower()
+    return _score_hook_full(hook_text, hook_type, niche, platform).score
+
+
+def _score_hook_full(hook_text: str, hook_type: str, niche: str, platform: str) -> _ScoreBreakdown:
+    return _score_with_ctx(hook_text, hook_text.lower(), _static_ctx(niche, platform, hook_type))
+
+
+def _score_with_ctx(hook_text: str, text_lower: str, ctx: _ScoreCtx) -> _ScoreBreakdown:
+    """The dynamic half of scoring — callers supply the lowered text and the
+    resolved static context so batch loops pay for neither per hook."""
     score = 0.0
 
     # ── Specificity (3.0 pts) ─────────────────────────────────────────────────
     spec_score = 1.5  # baseline
     # Numbers boost specificity
-    if re.search(r'\b\d+[\.\d]*%|\b\d+\s*(years?|months?|quarters?|weeks?)\b|\b\d{2,}\b', hook_text):
+    if _SPEC_NUM_RE.search(hook_text):
         spec_score += 0.8
     # Named entities / proper nouns boost specificity
-    if re.search(r'\b[A-Z][a-z]+ [A-Z][a-z]+|\bGPT-\d|\bLinkedIn\b|\bHBS\b|\bNigerian\b', hook_text):
+    if _SPEC_ENTITY_RE.search(hook_text):
         spec_score += 0.5
     # Vague quantifiers reduce specificity
-    if re.search(r'\b(many|some|often|sometimes|various|a lot of|things like)\b', text_lower):
+    if _VAGUE_RE.search(text_lower):
         spec_score -= 0.5
     score += min(3.0, max(0.0, spec_score))
 
@@ -215,22 +319,25 @@ def score_hook(hook_text: str, hook_type: str, niche: str, platform: str) -> flo
     voice_score = 1.8  # baseline
 
     # Banned opener check
-    for opener in config.get("banned_openers", []):
-        if text_lower.startswith(opener.lower()):
+    banned_opener = None
+    if ctx.banned_re is not None:
+        m = ctx.banned_re.match(text_lower)
+        if m:
+            banned_opener = m.group(1)
             voice_score -= 1.5
-            break
 
-    # Banned pattern check
-    for pattern in config.get("avoid_patterns", []):
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            voice_score -= 0.7
-            break
+    # Banned pattern check — the union regex decides hit/no-hit in one scan;
+    # only on a hit (rare) are the individual patterns enumerated for notes
+    avoid_hits: tuple[str, ...] = ()
+    if ctx.avoid_re is not None and ctx.avoid_re.search(text_lower):
+        voice_score -= 0.7
+        avoid_hits = tuple(
+            raw for pat, raw in ctx.avoid_patterns if pat.search(text_lower)
+        )
 
     # Green flag starters boost
-    for starter in config.get("green_flag_starters", []):
-        if text_lower.startswith(starter.lower()):
-            voice_score += 0.8
-            break
+    if ctx.green_re is not None and ctx.green_re.match(text_lower):
+        voice_score += 0.8
 
     score += min(2.5, max(0.0, voice_score))
 
@@ -238,46 +345,39 @@ def score_hook(hook_text: str, hook_type: str, niche: str, platform: str) -> flo
     tension_score = 1.2  # baseline
 
     # Contradiction / contrast creates tension
-    if re.search(r'\b(but|not|never|wrong|fail|missed|nobody|no one|instead|actually)\b', text_lower):
+    if _TENSION_CONTRAST_RE.search(text_lower):
         tension_score += 0.6
     # Unexplained reference creates curiosity
-    if re.search(r'\b(this|that|here\'s|it)\b.*\b(why|how|what)\b', text_lower):
+    if _TENSION_REFERENCE_RE.search(text_lower):
         tension_score += 0.4
     # Direct address creates immediacy
-    if re.search(r'\b(you|your|you\'ve|you\'re)\b', text_lower):
+    if _TENSION_DIRECT_RE.search(text_lower):
         tension_score += 0.3
 
     score += min(2.5, max(0.0, tension_score))
 
     # ── Platform fit (2.0 pts) ────────────────────────────────────────────────
     platform_score = 1.0  # baseline
-    if platform in PLATFORM_HOOK_SPECS:
-        max_chars = PLATFORM_HOOK_SPECS[platform]["max_chars"]
+    if ctx.max_chars is not None:
         char_len = len(hook_text)
-        if char_len <= max_chars:
+        if char_len <= ctx.max_chars:
             platform_score += 0.8
-        elif char_len <= max_chars * 1.2:
+        elif char_len <= ctx.max_chars * 1.2:
             platform_score += 0.3
         else:
             platform_score -= 0.5
 
     # Type-platform affinity bonus
-    type_platform_matrix = {
-        "curiosity_gap":   ["linkedin", "newsletter"],
-        "bold_claim":      ["linkedin", "twitter"],
-        "personal_story":  ["linkedin", "instagram", "facebook", "newsletter"],
-        "data_shock":      ["linkedin", "newsletter", "twitter"],
-        "pattern_interrupt": ["twitter", "instagram"],
-        "question":        ["instagram", "facebook", "twitter"],
-        "contrarian":      ["twitter", "linkedin"],
-        "number_list":     ["linkedin", "newsletter"],
-    }
-    if platform in type_platform_matrix.get(hook_type, []):
-        platform_score += 0.2
+    platform_score += ctx.type_bonus
 
     score += min(2.0, max(0.0, platform_score))
 
-    return round(min(10.0, max(0.0, score)), 1)
+    return _ScoreBreakdown(
+        score=round(min(10.0, max(0.0, score)), 1),
+        banned_opener=banned_opener,
+        avoid_hits=avoid_hits,
+        length_ok=len(hook_text) <= (ctx.max_chars if ctx.max_chars is not None else 999),
+    )
 
 
 def get_score_label(score: float) -> str:
@@ -291,72 +391,79 @@ def get_score_label(score: float) -> str:
 
 # ── Hook generation ───────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1024)
 def _build_hook_text(hook_type: str, niche: str, topic: str, context: str = "") -> str:
     """
     Build a hook from the template scaffold + topic + niche config.
     Returns a complete, usable hook string.
+
+    Pure function of its (hashable, string) arguments, so repeat topics —
+    common in week batches and scheduled-content scripts — hit the cache
+    instead of rebuilding the template strings. Anyone mutating
+    NICHE_HOOK_CONFIG at runtime should call _build_hook_text.cache_clear().
     """
-    config = NICHE_HOOK_CONFIG[niche]
     topic_clean = topic.strip().rstrip(".")
-
-    # Pick the best green-flag starter for niche (first item in list)
-    green_starter = config["green_flag_starters"][0] if config["green_flag_starters"] else ""
-
-    hooks = {
-        "curiosity_gap": (
-            f"Nobody prepares you for the moment when {topic_clean} stops being a strategy "
-            f"and becomes a mirror."
-            if not context else
+    # Shared pieces computed once; each branch below formats only its own
+    # template instead of building all nine strings to return one.
+    context_cap = context.capitalize() if context else ""
+
+    if hook_type == "curiosity_gap":
+        if not context:
+            return (
+                f"Nobody prepares you for the moment when {topic_clean} stops being a strategy "
+                f"and becomes a mirror."
+            )
+        return (
             f"Most people get {topic_clean} wrong — not because of effort, but because "
             f"{context}."
-        ),
-        "bold_claim": (
-            f"The common advice on {topic_clean} is optimizing the wrong layer."
-            if not context else
-            f"{topic_clean.capitalize()} isn't a tools problem. {context.capitalize()}."
-        ),
-        "personal_story": (
-            f"I sat with {topic_clean} for three years before I understood what it was "
-            f"actually asking of me."
-            if not context else
-            f"I built the whole thing — {context}. That's when {topic_clean} finally made sense."
-        ),
-        "data_shock": (
-            f"The stat on {topic_clean} that nobody leads with: "
-            f"most people are solving the wrong version of the problem."
-            if not context else
+        )
+    if hook_type == "bold_claim":
+        if not context:
+            return f"The common advice on {topic_clean} is optimizing the wrong layer."
+        return f"{topic_clean.capitalize()} isn't a tools problem. {context_cap}."
+    if hook_type == "personal_story":
+        if not context:
+            return (
+                f"I sat with {topic_clean} for three years before I understood what it was "
+                f"actually asking of me."
+            )
+        return f"I built the whole thing — {context}. That's when {topic_clean} finally made sense."
+    if hook_type == "data_shock":
+        if not context:
+            return (
+                f"The stat on {topic_clean} that nobody leads with: "
+                f"most people are solving the wrong version of the problem."
+            )
+        return (
             f"Here's the number that changed how I think about {topic_clean}: "
             f"{context}."
-        ),
-        "pattern_interrupt": (
-            f"The {topic_clean} conversation is happening in the wrong room."
-            if not context else
-            f"You didn't fail at {topic_clean}. {context.capitalize()}."
-        ),
-        "question": (
-            f"What are you actually building when you invest everything into {topic_clean}?"
-            if not context else
-            f"If {context}, what does that say about how we've framed {topic_clean}?"
-        ),
-        "contrarian": (
-            f"Everyone's focused on {topic_clean}. Nobody's asking whether the framing is right."
-            if not context else
+        )
+    if hook_type == "pattern_interrupt":
+        if not context:
+            return f"The {topic_clean} conversation is happening in the wrong room."
+        return f"You didn't fail at {topic_clean}. {context_cap}."
+    if hook_type == "question":
+        if not context:
+            return f"What are you actually building when you invest everything into {topic_clean}?"
+        return f"If {context}, what does that say about how we've framed {topic_clean}?"
+    if hook_type == "contrarian":
+        if not context:
+            return f"Everyone's focused on {topic_clean}. Nobody's asking whether the framing is right."
+        return (
             f"The conventional wisdom on {topic_clean} sounds correct. "
-            f"{context.capitalize()} — and that changes everything."
-        ),
-        "number_list": (
-            f"3 things about {topic_clean} that most frameworks completely miss."
-            if not context else
-            f"3 patterns I keep seeing in {topic_clean} — and {context}."
-        ),
-    }
+            f"{context_cap} — and that changes everything."
+        )
+    if hook_type == "number_list":
+        if not context:
+            return f"3 things about {topic_clean} that most frameworks completely miss."
+        return f"3 patterns I keep seeing in {topic_clean} — and {context}."
 
-    return hooks.get(hook_type, f"On {topic_clean}: {context or 'something worth examining.'}")
+    return f"On {topic_clean}: {context or 'something worth examining.'}"
 
 
 # ── Data classes ───────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class HookResult:
     hook_type: str
     text: str
@@ -366,7 +473,7 @@ class HookResult:
     rank: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class HookReport:
     niche: str
     platform: str
@@ -380,6 +487,27 @@ class HookReport:
         return self.hooks[0] if self.hooks else None
 
 
+@functools.lru_cache(maxsize=None)
+def _field_names(cls) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _to_dict(obj) -> dict:
+    """Serialize a HookResult/HookReport without dataclasses.asdict.
+
+    asdict deep-copies every nested container; the fields here are strings,
+    floats and ints apart from HookReport.hooks, so a direct field walk with
+    one recursion for the hooks list emits identical JSON minus the copies.
+    """
+    out = {}
+    for name in _field_names(type(obj)):
+        value = getattr(obj, name)
+        if name == "hooks":
+            value = [_to_dict(h) for h in value]
+        out[name] = value
+    return out
+
+
 # ── Core generation function ──────────────────────────────────────────────────
 
 def generate_hooks(
@@ -393,27 +521,23 @@ def generate_hooks(
     if niche not in VALID_NICHES:
         raise ValueError(f"Unknown niche: {niche}. Valid: {VALID_NICHES}")
 
+    best_types = NICHE_HOOK_CONFIG[niche]["best_types"]  # hoisted out of the loop
+
     hooks = []
     for hook_type in HOOK_TYPES:
         text = _build_hook_text(hook_type, niche, topic, context)
-        score = score_hook(text, hook_type, niche, platform)
-        label = get_score_label(score)
+        bd = _score_with_ctx(text, text.lower(), _static_ctx(niche, platform, hook_type))
 
-        # Build notes
+        # Build notes straight from the scoring breakdown — no second scan
         notes_parts = []
-        config = NICHE_HOOK_CONFIG[niche]
-        text_lower = text.lower()
-
-        for ban in config.get("banned_openers", []):
-            if text_lower.startswith(ban.lower()):
-                notes_parts.append(f"⚠️ Starts with banned opener: \"{ban}\"")
-        for pat in config.get("avoid_patterns", []):
-            if re.search(pat, text_lower, re.IGNORECASE):
-                notes_parts.append(f"⚠️ Contains avoid-pattern: {pat}")
+        if bd.banned_opener:
+            notes_parts.append(f"⚠️ Starts with banned opener: \"{bd.banned_opener}\"")
+        for raw in bd.avoid_hits:
+            notes_parts.append(f"⚠️ Contains avoid-pattern: {raw}")
         if not notes_parts:
-            if hook_type in NICHE_HOOK_CONFIG[niche]["best_types"]:
+            if hook_type in best_types:
                 notes_parts.append(f"✅ Preferred type for {niche}")
-            if len(text) <= PLATFORM_HOOK_SPECS.get(platform, {}).get("max_chars", 999):
+            if bd.length_ok:
                 notes_parts.append(f"✅ Length fits {platform}")
             else:
                 notes_parts.append(f"⚠️ Slightly long for {platform}")
@@ -421,13 +545,15 @@ def generate_hooks(
         hooks.append(HookResult(
             hook_type=hook_type,
             text=text,
-            score=score,
-            label=label,
+            score=bd.score,
+            label=get_score_label(bd.score),
             notes=" | ".join(notes_parts) if notes_parts else "No issues",
         ))
 
-    # Sort by score descending, assign ranks
-    hooks.sort(key=lambda h: h.score, reverse=True)
+    # Sort by score descending, assign ranks. attrgetter keeps the key in C;
+    # every hook needs a rank regardless of top_n, so a partial selection via
+    # heapq would still leave a full sort to do.
+    hooks.sort(key=attrgetter("score"), reverse=True)
     for i, h in enumerate(hooks, 1):
         h.rank = i
 
@@ -445,20 +571,29 @@ def generate_hooks(
     return report_obj
 
 
+# Type-detection patterns, compiled once. The cascade order below is
+# semantic priority (number_list outranks data_shock for "5 reasons…"),
+# not cost order — reordering would change which type wins.
+_DETECT_NUMBER_LIST_RE = re.compile(r'\b\d+[\s]*(%|reasons?|ways?|things?|patterns?)\b')
+_DETECT_DATA_SHOCK_RE = re.compile(r'\b\d+[\.\d]*%\b')
+_DETECT_CONTRARIAN_RE = re.compile(r'\b(everyone|conventional|common|popular)\b')
+
+
 def score_existing_hook(hook_text: str, niche: str, platform: str = "linkedin") -> HookResult:
     """Score an existing hook string without generating new ones."""
-    # Detect hook type by pattern
+    # Detect hook type by pattern (text_lower is kept — the startswith check
+    # needs it, and scoring lowers the text anyway)
     text_lower = hook_text.lower()
     detected_type = "curiosity_gap"  # default
-    if re.search(r'\b\d+[\s]*(%|reasons?|ways?|things?|patterns?)\b', text_lower):
+    if _DETECT_NUMBER_LIST_RE.search(text_lower):
         detected_type = "number_list"
     elif text_lower.startswith(("i ", "my ", "last ", "three years")):
         detected_type = "personal_story"
-    elif re.search(r'\b\d+[\.\d]*%\b', text_lower):
+    elif _DETECT_DATA_SHOCK_RE.search(text_lower):
         detected_type = "data_shock"
     elif "?" in hook_text:
         detected_type = "question"
-    elif re.search(r'\b(everyone|conventional|common|popular)\b', text_lower):
+    elif _DETECT_CONTRARIAN_RE.search(text_lower):
         detected_type = "contrarian"
 
     score = score_hook(hook_text, detected_type, niche, platform)
@@ -536,7 +671,7 @@ Examples:
     if args.score_hook:
         result = score_existing_hook(args.score_hook, args.niche, args.platform)
         if args.json:
-            print(json.dumps(asdict(result), indent=2))
+            print(json.dumps(_to_dict(result), indent=2))
         else:
             print(f"\nHook Score: {result.score}/10  →  {result.label}")
             print(f"Detected type: {result.hook_type}")
@@ -555,7 +690,7 @@ Examples:
     )
 
     if args.json:
-        print(json.dumps(asdict(report), indent=2, default=str))
+        print(json.dumps(_to_dict(report), indent=2, default=str))
     else:
         print(report.report)
 